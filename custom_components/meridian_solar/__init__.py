@@ -1,17 +1,28 @@
 """The Meridian Solar integration."""
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+import csv
 from datetime import timedelta, datetime
+from html.parser import HTMLParser
+from itertools import islice
 import logging
+import random
 import re
+import statistics
+import time
 import asyncio
 import aiohttp
+import codecs
 from typing import Any
 from urllib.parse import urljoin
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -19,22 +30,458 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
+from .const import CONF_LOGIN_URL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-# Enable more detailed logging for debugging
-_LOGGER.setLevel(logging.DEBUG)
-
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 SCAN_INTERVAL = timedelta(minutes=30)
 
+# Rates rarely change within a day; extracted rates are reused this long
+RATE_CACHE_TTL = timedelta(hours=6)
+# Reasonable rate range for NZ, in $/kWh; anything outside is not a rate
+MIN_RATE = 0.15
+MAX_RATE = 0.50
+# Candidate rates collected per page before settling on one
+RATE_SAMPLES = 3
+
+# Refresh requests within this many seconds collapse into one portal sweep
+REQUEST_REFRESH_COOLDOWN = 10.0
+
+# Retry policy for portal page requests (exponential backoff with full jitter)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
 # Customer Portal Configuration (will be updated by discovery)
 BASE_URL = "https://secure.meridianenergy.co.nz"
 LOGIN_URL = f"{BASE_URL}/login"
-DASHBOARD_URL = f"{BASE_URL}/"
-USAGE_URL = f"{BASE_URL}/"
-BILLING_URL = f"{BASE_URL}/"
+
+# Data pages on the portal host; these don't move with login discovery
+USAGE_CHART_URL = f"{BASE_URL}/usage"
+FEED_IN_REPORT_URL = f"{BASE_URL}/feed_in_report"
+CSV_DOWNLOAD_URLS = (
+    f"{BASE_URL}/feed_in_report.csv",
+    f"{BASE_URL}/feed_in_report/download",
+    f"{BASE_URL}/feed_in_report/export",
+    f"{BASE_URL}/customers/feed_in_report.csv",
+)
+RATE_PAGE_URLS = (
+    (f"{BASE_URL}/billing", "billing"),
+    (f"{BASE_URL}/account", "account"),
+    (USAGE_CHART_URL, "usage"),
+    (f"{BASE_URL}/rates", "rates"),
+)
+
+# Default timeout for every request made on the portal session
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Browser-like User-Agent sent with every portal request. HA pins the
+# session's default User-Agent, so this has to go on each request instead.
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Pages that are only checked for indicators are streamed in chunks; the
+# overlap must be longer than the longest indicator keyword
+_STREAM_CHUNK_SIZE = 16384
+_STREAM_OVERLAP = 32
+# Login forms sit near the top of the page; probes read no further than this
+_LOGIN_PROBE_MAX_BYTES = 32768
+# CSV downloads are decoded in chunks of this size
+_CSV_CHUNK_SIZE = 65536
+
+# ASCII-only lowercasing for raw page bytes; every keyword we look for is ASCII
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+# Page indicator keywords (lowercase); each set is scanned as one regex
+_LOGIN_INDICATORS = frozenset(('password', 'username', 'login', 'sign in', 'email'))
+_DASHBOARD_INDICATORS = frozenset((
+    'dashboard', 'account', 'usage', 'billing', 'solar',
+    'current balance', 'recent activity', 'meter reading',
+))
+_USAGE_INDICATORS = frozenset((
+    'average daily use', 'daily usage', 'usage chart', 'power usage',
+    'consumption', 'kwh', 'daily average', 'usage pattern',
+    'energy', 'electricity', 'meter', 'usage', 'daily', 'monthly',
+    'cost', 'bill', 'kw', 'kilowatt',
+))
+_SOLAR_INDICATORS = frozenset((
+    'feed in', 'feed-in', 'solar', 'generation', 'export',
+    'heatmap', 'csv', 'download', 'kwh', 'half hour',
+    'import', 'energy', 'electricity', 'meter', 'grid',
+    'kw', 'kilowatt', 'production', 'generated',
+))
+
+
+def _indicator_re(indicators: frozenset[str]) -> re.Pattern[str]:
+    """Compile indicator keywords into one case-insensitive alternation."""
+    # Longest first so e.g. "kwh" wins over "kw" at the same position
+    ordered = sorted(indicators, key=lambda i: (-len(i), i))
+    return re.compile("|".join(re.escape(i) for i in ordered), re.IGNORECASE)
+
+
+def _indicator_bytes_re(indicators: frozenset[str]) -> re.Pattern[bytes]:
+    """Compile indicator keywords for scanning raw (undecoded) page bytes."""
+    return re.compile(_indicator_re(indicators).pattern.encode(), re.IGNORECASE)
+
+
+def _find_indicators(pattern: re.Pattern[str], html: str, limit: int) -> list[str]:
+    """Return up to limit distinct indicators found in html, in page order."""
+    found: dict[str, None] = {}
+    for match in pattern.finditer(html):
+        found[match.group().lower()] = None
+        if len(found) >= limit:
+            break
+    return list(found)
+
+
+async def _stream_indicators(
+    response: aiohttp.ClientResponse,
+    pattern: re.Pattern[bytes],
+    limit: int,
+    max_bytes: int | None = None,
+) -> list[str]:
+    """Return distinct indicators from a streamed body, stopping at limit.
+
+    The body is scanned chunk by chunk rather than read whole; a short tail
+    of each chunk is carried over so indicators split across chunks match.
+    With max_bytes, only that much of the body is read.
+    """
+    found: dict[str, None] = {}
+    tail = b""
+    read = 0
+    async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+        buffer = tail + chunk
+        for match in pattern.finditer(buffer):
+            found[match.group().decode().lower()] = None
+            if len(found) >= limit:
+                return list(found)
+        read += len(chunk)
+        if max_bytes is not None and read >= max_bytes:
+            break
+        tail = buffer[-_STREAM_OVERLAP:]
+    return list(found)
+
+
+async def _read_csv_lines(response: aiohttp.ClientResponse) -> list[str]:
+    """Return the non-blank lines of a streamed CSV body.
+
+    The body is decoded incrementally in large chunks, so it is never held
+    as one string and there is no per-line await.
+    """
+    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+    lines: list[str] = []
+    pending = ""
+    async for chunk in response.content.iter_chunked(_CSV_CHUNK_SIZE):
+        *complete, pending = (pending + decoder.decode(chunk)).split("\n")
+        lines.extend(line.rstrip("\r") for line in complete if line.strip())
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        lines.append(pending.rstrip("\r"))
+    return lines
+
+
+def _redirected_to_login(response: aiohttp.ClientResponse) -> bool:
+    """Return True if the portal redirected the request to its login page."""
+    return bool(response.history) and "login" in response.url.path
+
+
+async def _gather_or_cancel(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+    """Run coroutines concurrently; if one raises, cancel the rest first.
+
+    A plain gather would leave the other fetches running after the update
+    has already failed.
+    """
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+_LOGIN_RE = _indicator_bytes_re(_LOGIN_INDICATORS)
+_DASHBOARD_RE = _indicator_bytes_re(_DASHBOARD_INDICATORS)
+_USAGE_RE = _indicator_re(_USAGE_INDICATORS)
+_SOLAR_RE = _indicator_re(_SOLAR_INDICATORS)
+
+# Login form fields that may carry the CSRF token, in order of preference
+_CSRF_FIELD_NAMES = ('_token', 'csrf_token', 'authenticity_token')
+# Link targets that look like a CSV export, in order of preference
+_CSV_LINK_KEYWORDS = ('.csv', 'download', 'export')
+
+# Rate formats seen on the portal pages, fused into one alternation so each
+# page is scanned once; every alternative has exactly one capture group
+_RATE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            # Standard rate formats
+            r'(\d{1,6}(?:\.\d{1,6})?)\s*c(?:ents)?/kWh',  # e.g., "25.5 c/kWh"
+            r'(\d{1,6}(?:\.\d{1,6})?)\s*cents?\s*per\s*kWh',  # e.g., "25.5 cents per kWh"
+            r'\$(\d{1,6}(?:\.\d{1,6})?)\s*per\s*kWh',  # e.g., "$0.255 per kWh"
+            r'Rate[:\s]{0,20}\$?(\d{1,6}(?:\.\d{1,6})?)',  # e.g., "Rate: $0.255"
+            r'Price[:\s]{0,20}\$?(\d{1,6}(?:\.\d{1,6})?)',  # e.g., "Price: 0.255"
+            r'(\d{1,6}(?:\.\d{1,6})?)\s*¢/kWh',  # e.g., "25.5¢/kWh"
+            # Table/structured formats; lazy gaps so the first number is taken
+            r'<td[^>]{0,200}>\s*\$?(\d{1,6}(?:\.\d{1,6})?)\s*</td>',  # Table cells
+            r'current[^>]{0,200}?rate[^>]{0,200}?\$?(\d{1,6}(?:\.\d{1,6})?)',  # Current rate
+            r'next[^>]{0,200}?rate[^>]{0,200}?\$?(\d{1,6}(?:\.\d{1,6})?)',  # Next rate
+            # JSON-like formats (if rates in data attributes)
+            r'"rate"[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)',
+            r'"current_rate"[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)',
+            r'"next_rate"[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)',
+        )
+    ),
+    re.IGNORECASE,
+)
+# Places the dashboard scripts may reference data endpoints, as one alternation
+_ENDPOINT_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r'fetch\(["\']([^"\']{1,500})["\']',  # Fetch calls
+            r'\.get\(["\']([^"\']{1,500})["\']',  # GET calls
+            r'url[:\s]{0,20}["\']([^"\']{1,500})["\']',  # URL definitions
+            r'["\']([^"\']{0,500}api[^"\']{0,500})["\']',  # API URLs
+            r'["\']([^"\']{0,500}ajax[^"\']{0,500})["\']',  # AJAX URLs
+            r'["\']([^"\']{0,500}data[^"\']{0,500})["\']',  # Data URLs
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# HTML scraping patterns, compiled once at import
+_CSRF_SCRIPT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'"csrf_token":"([^"]{1,500})"',
+        r'_token["\']:\s*["\']([^"\']{1,500})["\']',
+    )
+)
+_USAGE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'average\s*daily\s*use[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)\s*kWh',  # Average daily use
+        r'daily\s*average[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)\s*kWh',  # Daily average
+        r'(\d{1,6}(?:\.\d{1,6})?)\s*kWh\s*per\s*day',  # kWh per day
+        r'(\d{1,6}(?:\.\d{1,6})?)\s*kWh',  # General kWh values
+        r'usage[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)\s*kWh',  # Usage amounts
+    )
+)
+_SOLAR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\d{1,6}(?:\.\d{1,6})?)\s*kWh',  # kWh values
+        r'feed.?in[:\s]{0,20}\$?(\d{1,6}(?:\.\d{1,6})?)',  # Feed-in amounts
+        r'export[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)',  # Export amounts
+        r'generation[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)',  # Generation amounts
+        r'total[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)',  # Total amounts
+    )
+)
+# Usage figures the dashboard may show, with a description for the logs
+_DASHBOARD_USAGE_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in (
+        # Daily usage patterns
+        (r'today[^>]{0,200}(\d{1,6}(?:\.\d{1,6})?)\s*kWh', 'today usage'),
+        (r'daily[^>]{0,200}use[^>]{0,200}(\d{1,6}(?:\.\d{1,6})?)\s*kWh', 'daily use'),
+        (r'consumption[^>]{0,200}(\d{1,6}(?:\.\d{1,6})?)\s*kWh', 'consumption'),
+        (r'used[^>]{0,200}(\d{1,6}(?:\.\d{1,6})?)\s*kWh', 'used'),
+
+        # Average patterns
+        (r'average[^>]{0,200}(\d{1,6}(?:\.\d{1,6})?)\s*kWh', 'average usage'),
+        (r'(\d{1,6}(?:\.\d{1,6})?)\s*kWh[^>]{0,200}average', 'kWh average'),
+        (r'monthly[^>]{0,200}average[^>]{0,200}(\d{1,6}(?:\.\d{1,6})?)', 'monthly average'),
+
+        # Dashboard specific patterns
+        (r'class="usage"[^>]{0,200}>(\d{1,6}(?:\.\d{1,6})?)', 'usage class'),
+        (r'data-usage="(\d{1,6}(?:\.\d{1,6})?)"', 'usage data attribute'),
+        (r'"usage"[:\s]{0,20}(\d{1,6}(?:\.\d{1,6})?)', 'JSON usage'),
+
+        # General energy patterns
+        (r'(\d{1,6}(?:\.\d{1,6})?)\s*kWh[^>]{0,200}day', 'kWh per day'),
+        (r'(\d{1,6}(?:\.\d{1,6})?)\s*kWh[^>]{0,200}consumption', 'kWh consumption'),
+
+        # Table patterns
+        (r'<td[^>]{0,200}>(\d{1,6}(?:\.\d{1,6})?)\s*kWh</td>', 'table cell kWh'),
+    )
+)
+
+
+def _safe_float(field: str) -> float:
+    """Convert a CSV reading, treating blank or non-numeric fields as 0."""
+    # Blank cells are common in partial days; reject them without raising
+    if not field or field[0] not in "0123456789.-+ ":
+        return 0.0
+    try:
+        return float(field)
+    except ValueError:
+        return 0.0
+
+
+def _half_hour_values(parts: list[str]) -> list[float]:
+    """Return the 48 half-hour readings (columns 4-51) of a CSV row."""
+    fields = parts[4:52]
+    try:
+        return list(map(float, fields))
+    except ValueError:
+        # Only rows with blank or malformed readings take the slow path
+        return [_safe_float(field) for field in fields]
+
+
+def _half_hour_total(parts: list[str]) -> float:
+    """Return the sum of a CSV row's 48 half-hour readings."""
+    try:
+        # Sum straight off the conversion without building a list
+        return sum(map(float, parts[4:52]))
+    except ValueError:
+        return sum(_half_hour_values(parts))
+
+
+def _total_and_last_positive(parts: list[str]) -> tuple[float, float | None]:
+    """Return a CSV row's half-hour total and its latest positive reading.
+
+    Each field is converted once and both results come off that one list.
+    """
+    values = _half_hour_values(parts)
+    last_positive = next((value for value in reversed(values) if value > 0), None)
+    return sum(values), last_positive
+
+
+def _apply_feed_in(data: dict[str, float], parts: list[str]) -> None:
+    """Fill the day's feed-in total and latest generation from its row."""
+    data["daily_feed_in"], generation = _total_and_last_positive(parts)
+    # Current generation is the latest non-zero value
+    if generation is not None:
+        data["solar_generation"] = generation
+
+
+def _apply_consumption(data: dict[str, float], parts: list[str]) -> None:
+    """Fill the day's consumption total from its row."""
+    data["daily_consumption"] = _half_hour_total(parts)
+
+
+# CSV meter element -> handler filling its values into the update data
+_METER_HANDLERS = {
+    "Feed-in": _apply_feed_in,
+    "Consumption": _apply_consumption,
+}
+
+
+def _apply_meter_rows(data: dict[str, float], meters: dict[str, list[str]]) -> None:
+    """Fill the day's totals in data from its meter rows."""
+    for meter_element, parts in meters.items():
+        _METER_HANDLERS[meter_element](data, parts)
+
+
+def _date_key(date: str) -> tuple[int, ...]:
+    """Return a sortable (year, month, day) key for a CSV date like 1/9/2025.
+
+    Unparseable dates give an empty key, which sorts before any real date.
+    """
+    try:
+        day, month, year = map(int, date.split("/"))
+    except ValueError:
+        return ()
+    return year, month, day
+
+
+def _parse_csv(lines: list[str], today: str) -> dict[str, float]:
+    """Return today's meter totals and the average daily use from CSV lines.
+
+    Runs in the executor, so it must not touch the event loop.
+    """
+    data = {
+        "solar_generation": 0.0,
+        "daily_consumption": 0.0,
+        "daily_feed_in": 0.0,
+        "average_daily_use": 0.0,
+    }
+    
+    # One pass over the rows (skipping the header). Only today's and the
+    # most recent day's meter rows are kept, whatever order the export lists
+    # them in; consumption history is reduced to a running total as it
+    # streams past
+    today_rows: dict[str, list[str]] = {}
+    latest_date = None
+    latest_key: tuple[int, ...] | None = None
+    latest_rows: dict[str, list[str]] = {}
+    consumption_total = 0.0
+    consumption_days = 0
+    for parts in csv.reader(islice(lines, 1, None)):
+        if len(parts) < 52:  # Header + 48 half-hour periods + extras
+            continue
+        
+        meter_element = parts[2]  # Feed-in or Consumption
+        date = parts[3]
+        if meter_element not in _METER_HANDLERS:
+            continue
+        date_key = _date_key(date)
+        if latest_key is None or date_key > latest_key:
+            latest_date, latest_key = date, date_key
+            latest_rows = {}
+        if date_key == latest_key:
+            latest_rows[meter_element] = parts
+        if date == today:
+            today_rows[meter_element] = parts
+        
+        if meter_element == "Consumption":
+            daily_total = _half_hour_total(parts)
+            if daily_total > 0:  # Only count days with actual usage
+                consumption_total += daily_total
+                consumption_days += 1
+                _LOGGER.debug("Day %s: %.2f kWh consumption", date, daily_total)
+    
+    if consumption_days:
+        # Calculate average from available data
+        average = consumption_total / consumption_days
+        _LOGGER.info("✅ Calculated average daily usage from %d days: %.2f kWh", consumption_days, average)
+        data["average_daily_use"] = round(average, 2)
+    else:
+        _LOGGER.warning("⚠️ No consumption data found in CSV for average calculation")
+    
+    _apply_meter_rows(data, today_rows)
+    
+    # If no data found for today, use the most recent date instead
+    if data['daily_consumption'] == 0.0 and data['daily_feed_in'] == 0.0:
+        _LOGGER.debug("No data found for today (%s), looking for most recent data...", today)
+        if latest_date is not None:
+            _LOGGER.debug("Using most recent date: %s", latest_date)
+            _apply_meter_rows(data, latest_rows)
+    
+    return data
+
+
+class _PageParser(HTMLParser):
+    """Collect the form action, input values and links from a portal page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.form_action: str | None = None
+        self.inputs: dict[str, str] = {}
+        self.links: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        if tag == "form":
+            if self.form_action is None and attributes.get("action"):
+                self.form_action = attributes["action"]
+        elif tag == "input":
+            name = attributes.get("name")
+            if name and attributes.get("value"):
+                self.inputs.setdefault(name, attributes["value"])
+        elif tag == "a":
+            if attributes.get("href"):
+                self.links.append(attributes["href"])
+
+
+def _parse_page(html: str) -> _PageParser:
+    """Parse html and return the collected form and link details."""
+    parser = _PageParser()
+    parser.feed(html)
+    parser.close()
+    return parser
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Meridian Solar from a config entry."""
@@ -47,7 +494,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
+        session=async_create_portal_session(hass),
         update_interval=scan_interval,
+        login_url=entry.data.get(CONF_LOGIN_URL),
     )
 
     try:
@@ -55,6 +504,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except UpdateFailed as err:
         raise ConfigEntryNotReady(f"Failed to connect to Meridian Energy: {err}") from err
 
+    # Persist the discovered login URL so restarts skip the discovery probes.
+    # This runs before the update listener is registered to avoid a reload.
+    if (
+        coordinator.discovered_login_url
+        and coordinator.discovered_login_url != entry.data.get(CONF_LOGIN_URL)
+    ):
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_LOGIN_URL: coordinator.discovered_login_url},
+        )
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -64,6 +524,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     return True
 
+@callback
+def async_create_portal_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Create the session used for one portal login."""
+    # HA's pooled connector (keep-alive, DNS cache) with our own cookie jar,
+    # kept for the life of the coordinator and closed in async_stop
+    return async_create_clientsession(hass, timeout=REQUEST_TIMEOUT)
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -87,7 +554,9 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         username: str,
         password: str,
+        session: aiohttp.ClientSession,
         update_interval: timedelta = SCAN_INTERVAL,
+        login_url: str | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -95,27 +564,128 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Wait out the cooldown so a burst of requests costs one sweep
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+            # The data is a plain dict of floats, so an unchanged poll
+            # compares equal and listeners are not called
+            always_update=False,
         )
         self.username = username
         self.password = password
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
         self._logged_in = False
+        self._login_lock = asyncio.Lock()
+        self._header_cache: dict[str, dict[str, str]] = {}
         self._csrf_token: str | None = None
         self._form_action_url: str | None = None
-        self._retry_count = 0
+        self._rate_cache: tuple[float, dict[str, float]] | None = None
+        # CSV URL -> (conditional request headers, lines) of the last download
+        self._csv_cache: dict[str, tuple[dict[str, str], list[str]]] = {}
+        # CSV URL that served the last download; tried alone before probing
+        self._csv_url: str | None = None
+        # (lines, date) -> parsed result of the last CSV parse
+        self._parsed_csv: tuple[list[str], str, dict[str, float]] | None = None
+        self.discovered_login_url = login_url
         self.MAX_RETRIES = 3
         
         # Instance URLs that can be updated during discovery
         self.login_url = LOGIN_URL
-        self.dashboard_url = DASHBOARD_URL
-        self.usage_url = USAGE_URL
-        self.billing_url = BILLING_URL
+        self._build_urls(BASE_URL)
+
+    def _build_urls(self, base_url: str) -> None:
+        """Derive the per-entry portal URLs from the portal base URL."""
+        self.dashboard_url = f"{base_url}/"
+        self.usage_url = f"{base_url}/"
+        self.billing_url = f"{base_url}/"
+        # Dashboard first: it's already fetched, so it's the cheapest hit
+        self._rate_pages = ((self.dashboard_url, "dashboard"), *RATE_PAGE_URLS)
+
+    @asynccontextmanager
+    async def _get_with_retry(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        params: dict[str, str] | None = None,
+        raise_for_status: bool = False,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """GET a portal page, retrying transient failures with backoff.
+        
+        Only use this for idempotent GETs; the login POST is never retried.
+        """
+        for attempt in range(self.MAX_RETRIES):
+            last_attempt = attempt == self.MAX_RETRIES - 1
+            retry_after = None
+            try:
+                response = await self._session.get(
+                    url, headers=headers, params=params
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                if last_attempt:
+                    raise
+                reason = f"{type(err).__name__}: {err}"
+            else:
+                if response.status not in RETRY_STATUSES or last_attempt:
+                    try:
+                        self._check_session_expired(response)
+                        if raise_for_status:
+                            response.raise_for_status()
+                        yield response
+                    finally:
+                        response.release()
+                    return
+                
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After")
+                reason = f"status {response.status}"
+                response.release()
+            
+            # Full jitter spreads retries out after a portal outage
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+            if retry_after:
+                try:
+                    delay = max(float(retry_after), delay)
+                except ValueError:
+                    pass
+            
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Retrying %s in %.2fs (%s, attempt %d)",
+                    url, delay, reason, attempt + 1,
+                )
+            await asyncio.sleep(delay)
+
+    async def _probe_login_page(self, url: str) -> str | None:
+        """Return the final URL if url serves a login page, else None."""
+        try:
+            # A single attempt: candidates are speculative, so a host that
+            # doesn't answer is skipped rather than retried with backoff
+            async with self._session.get(url) as response:
+                _LOGGER.debug("Trying %s: %s", url, response.status)
+                
+                # Only HTML pages can be the login form; skip anything else unread
+                if response.status == 200 and 'html' in response.content_type:
+                    # Look for login indicators, stopping once we have enough
+                    found_indicators = await _stream_indicators(
+                        response, _LOGIN_RE, 2, _LOGIN_PROBE_MAX_BYTES
+                    )
+                    
+                    if len(found_indicators) >= 2:  # Need at least 2 login indicators
+                        _LOGGER.debug("Found login page at: %s", url)
+                        return str(response.url)  # Return the final URL after redirects
+                        
+        except Exception as e:
+            _LOGGER.debug("Error checking %s: %s", url, e)
+        
+        return None
 
     async def _discover_login_page(self) -> str:
         """Discover the correct login page URL."""
         _LOGGER.debug("Discovering login page...")
         
-        # Try different common URL patterns
+        # Try different common URL patterns, in order of preference
         potential_urls = [
             "https://secure.meridianenergy.co.nz/customers/",
             "https://secure.meridianenergy.co.nz/login",
@@ -126,179 +696,198 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             "https://portal.meridianenergy.co.nz/",
         ]
         
-        for url in potential_urls:
-            try:
-                async with self._session.get(url, allow_redirects=True) as response:
-                    _LOGGER.debug(f"Trying {url}: {response.status}")
-                    
-                    if response.status == 200:
-                        html = await response.text()
-                        # Look for login indicators
-                        login_indicators = ['password', 'username', 'login', 'sign in', 'email']
-                        found_indicators = sum(1 for indicator in login_indicators if indicator.lower() in html.lower())
-                        
-                        if found_indicators >= 2:  # Need at least 2 login indicators
-                            _LOGGER.debug(f"Found login page at: {url}")
-                            return str(response.url)  # Return the final URL after redirects
-                            
-            except Exception as e:
-                _LOGGER.debug(f"Error checking {url}: {e}")
-                continue
+        # Probe all candidates at once, but still honour the preference order:
+        # the first candidate that qualifies once its predecessors are done wins
+        tasks = [asyncio.create_task(self._probe_login_page(url)) for url in potential_urls]
+        try:
+            for task in tasks:
+                if login_url := await task:
+                    return login_url
+        finally:
+            for task in tasks:
+                task.cancel()
         
         _LOGGER.warning("No valid login page found")
         return ""
 
     async def _get_login_page(self) -> bool:
         """Get the login page and extract CSRF token."""
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-        
         _LOGGER.debug("Getting login page...")
         
-        # First discover the correct login URL
-        discovered_url = await self._discover_login_page()
+        # Reuse the login URL from a previous discovery when we have one
+        discovered_url = self.discovered_login_url or await self._discover_login_page()
         if not discovered_url:
             return False
+        self.discovered_login_url = discovered_url
         
         # Update our URLs based on discovery
         base_url = discovered_url.rsplit('/', 1)[0] if discovered_url.endswith('/') else discovered_url.rsplit('/', 1)[0]
         self.login_url = discovered_url
-        self.dashboard_url = f"{base_url}/"
-        self.usage_url = f"{base_url}/"
-        self.billing_url = f"{base_url}/"
+        self._build_urls(base_url)
         
         try:
-            async with asyncio.timeout(30):
-                async with self._session.get(self.login_url) as response:
-                    _LOGGER.debug(f"Login page status: {response.status}")
-                    
-                    if response.status != 200:
-                        raise UpdateFailed(f"Failed to get login page: {response.status}")
-                    
-                    html = await response.text()
-                    
-                    # Look for CSRF token in various common formats
-                    csrf_patterns = [
-                        r'name="_token"\s+value="([^"]+)"',
-                        r'name="csrf_token"\s+value="([^"]+)"',
-                        r'name="authenticity_token"\s+value="([^"]+)"',
-                        r'"csrf_token":"([^"]+)"',
-                        r'_token["\']:\s*["\']([^"\']+)["\']'
-                    ]
-                    
-                    for pattern in csrf_patterns:
-                        match = re.search(pattern, html, re.IGNORECASE)
+            async with self._session.get(self.login_url, raise_for_status=True) as response:
+                _LOGGER.debug("Login page status: %s", response.status)
+                
+                html = await response.text()
+                
+                page = _parse_page(html)
+
+                # Look for CSRF token in the form fields, then in inline scripts
+                for name in _CSRF_FIELD_NAMES:
+                    if name in page.inputs:
+                        self._csrf_token = page.inputs[name]
+                        break
+                else:
+                    for pattern in _CSRF_SCRIPT_PATTERNS:
+                        match = pattern.search(html)
                         if match:
                             self._csrf_token = match.group(1)
-                            _LOGGER.debug(f"Found CSRF token: {self._csrf_token[:20]}...")
                             break
-                    
-                    if not self._csrf_token:
-                        _LOGGER.debug("No CSRF token found, proceeding without it")
-                    
-                    # Look for form action
-                    form_action = re.search(r'<form[^>]*action=["\']([^"\']+)["\']', html, re.IGNORECASE)
-                    if form_action:
-                        action_url = form_action.group(1)
-                        _LOGGER.debug(f"Form action: {action_url}")
-                        # Store the correct action URL for later use
-                        self._form_action_url = urljoin(self.login_url, action_url) if action_url.startswith('/') else action_url
-                        _LOGGER.debug(f"Will submit to: {self._form_action_url}")
-                    else:
-                        _LOGGER.debug("No form action found, using current URL")
-                        self._form_action_url = self.login_url
-                    
-                    return True
-        except Exception as err:
-            raise UpdateFailed(f"Error getting login page: {err}")
+                if self._csrf_token:
+                    _LOGGER.debug("Found CSRF token: %s...", self._csrf_token[:20])
+                else:
+                    _LOGGER.debug("No CSRF token found, proceeding without it")
+                
+                # Look for form action
+                if page.form_action:
+                    action_url = page.form_action
+                    _LOGGER.debug("Form action: %s", action_url)
+                    # Store the correct action URL for later use
+                    self._form_action_url = urljoin(self.login_url, action_url) if action_url.startswith('/') else action_url
+                    _LOGGER.debug("Will submit to: %s", self._form_action_url)
+                else:
+                    _LOGGER.debug("No form action found, using current URL")
+                    self._form_action_url = self.login_url
+                
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise UpdateFailed(f"Error getting login page: {err}") from err
+
+    async def _ensure_logged_in(self) -> bool:
+        """Log in if there is no current login; cheap when already logged in."""
+        # Unlocked fast path; _authenticate re-checks under the login lock
+        if self._logged_in:
+            return True
+        return await self._authenticate()
 
     async def _authenticate(self) -> bool:
-        """Authenticate with Meridian Customer Portal."""
+        """Authenticate with Meridian Customer Portal, one login at a time."""
+        async with self._login_lock:
+            # Another caller may have logged in while we waited for the lock
+            if self._logged_in:
+                return True
+            try:
+                return await self._login()
+            except UpdateFailed:
+                # The login page may have moved; rediscover it next time
+                self.discovered_login_url = None
+                raise
+
+    async def _login(self) -> bool:
+        """Submit the portal login form."""
         _LOGGER.info("🔐 Starting authentication process...")
-        _LOGGER.debug(f"Username: {self.username}")
+        _LOGGER.debug("Username: %s", self.username)
         
         # First get the login page
         if not await self._get_login_page():
             return False
         
         try:
-            async with asyncio.timeout(30):
-                # Prepare login data with correct field names
-                login_data = {
-                    "email": self.username,
-                    "password": self.password,
-                    "commit": "Sign in",  # Submit button value
-                }
-                
-                # Add CSRF token if we found one
-                if self._csrf_token:
-                    login_data["authenticity_token"] = self._csrf_token
-                
-                # Set headers to mimic a browser
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    "Referer": self.login_url,
-                    "Content-Type": "application/x-www-form-urlencoded"
-                }
+            # Prepare login data with correct field names
+            login_data = {
+                "email": self.username,
+                "password": self.password,
+                "commit": "Sign in",  # Submit button value
+            }
+            
+            # Add CSRF token if we found one
+            if self._csrf_token:
+                login_data["authenticity_token"] = self._csrf_token
+            
+            # Set headers to mimic a browser
+            headers = {
+                **self._request_headers(self.login_url),
+                "Content-Type": "application/x-www-form-urlencoded",
+            }
+            
+            # Use the correct form action URL
+            submit_url = self._form_action_url or self.login_url
+            _LOGGER.debug("Submitting to: %s", submit_url)
+            
+            # Let aiohttp follow the post-login redirect so the session cookies
+            # land in one round trip; the first hop still says where we were sent
+            async with self._session.post(submit_url, data=login_data, headers=headers, max_redirects=5) as response:
+                login_response = response.history[0] if response.history else response
+                _LOGGER.debug("Authentication response status: %s", login_response.status)
                 
-                # Use the correct form action URL
-                submit_url = self._form_action_url or self.login_url
-                _LOGGER.debug(f"Submitting to: {submit_url}")
+                # Debug: Show response headers
+                location = login_response.headers.get('Location', '')
+                if location:
+                    _LOGGER.debug("Redirect to: %s", location)
                 
-                async with self._session.post(submit_url, data=login_data, headers=headers, allow_redirects=False) as response:
-                    _LOGGER.debug(f"Authentication response status: {response.status}")
+                # Check for successful login (redirect or 200 with success indicators)
+                if login_response.status in [200, 302, 303]:
+                    response_body = await response.read()
+                    response_lower = response_body.translate(_ASCII_LOWER)
+                    location_lower = location.lower()
                     
-                    # Debug: Show response headers
-                    location = response.headers.get('Location', '')
-                    if location:
-                        _LOGGER.debug(f"Redirect to: {location}")
+                    # Debug: Show first part of response
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        preview = response_body[:200].decode(errors="replace")
+                        _LOGGER.debug("Response preview: %s...", preview)
                     
-                    # Check for successful login (redirect or 200 with success indicators)
-                    if response.status in [200, 302, 303]:
-                        response_text = await response.text()
-                        
-                        # Debug: Show first part of response
-                        _LOGGER.debug(f"Response preview: {response_text[:200]}...")
-                        
-                        if (response.status in [302, 303] and 
-                            ('dashboard' in location.lower() or 'customers' in location.lower() or 
-                             'home' in location.lower() or location == '/')):
-                            _LOGGER.debug(f"Authentication successful (redirected to: {location})")
-                            self._logged_in = True
-                            return True
-                        elif 'dashboard' in response_text.lower() or 'welcome' in response_text.lower():
-                            _LOGGER.debug("Authentication successful")
-                            self._logged_in = True
-                            return True
-                        elif 'invalid' in response_text.lower() or 'incorrect' in response_text.lower():
-                            _LOGGER.error("Authentication failed: Invalid credentials")
-                            raise UpdateFailed("Invalid credentials")
-                        elif response.status in [302, 303]:
-                            # Follow the redirect to see where it goes
-                            _LOGGER.debug("Following redirect to check result...")
-                            try:
-                                async with self._session.get(urljoin(self.login_url, location), headers=headers) as redirect_response:
-                                    redirect_text = await redirect_response.text()
-                                    if ('dashboard' in redirect_text.lower() or 'welcome' in redirect_text.lower() or
-                                        'account' in redirect_text.lower()):
-                                        _LOGGER.debug("Authentication successful (confirmed via redirect)")
-                                        self._logged_in = True
-                                        return True
-                            except Exception as e:
-                                _LOGGER.warning(f"Error following redirect: {e}")
-                        
-                        _LOGGER.debug("Uncertain login result, checking dashboard access...")
-                        # Try to access dashboard to confirm login
-                        self._logged_in = True  # Assume success for now
-                        return await self._test_dashboard_access()
-                    else:
-                        error_text = await response.text()
-                        _LOGGER.error(f"Authentication failed: {error_text[:200]}...")
-                        raise UpdateFailed(f"Authentication failed: {response.status}")
+                    if (login_response.status in [302, 303] and 
+                        ('dashboard' in location_lower or 'customers' in location_lower or 
+                         'home' in location_lower or location == '/')):
+                        _LOGGER.debug("Authentication successful (redirected to: %s)", location)
+                        self._logged_in = True
+                        return True
+                    elif b'dashboard' in response_lower or b'welcome' in response_lower:
+                        _LOGGER.debug("Authentication successful")
+                        self._logged_in = True
+                        return True
+                    elif b'invalid' in response_lower or b'incorrect' in response_lower:
+                        _LOGGER.error("Authentication failed: Invalid credentials")
+                        raise UpdateFailed("Invalid credentials")
+                    elif response.history and b'account' in response_lower:
+                        _LOGGER.debug("Authentication successful (confirmed via redirect)")
+                        self._logged_in = True
+                        return True
                     
-        except Exception as err:
-            _LOGGER.error(f"Authentication error: {err}")
-            raise UpdateFailed(f"Error during authentication: {err}")
+                    _LOGGER.debug("Uncertain login result, checking dashboard access...")
+                    # Try to access dashboard to confirm login
+                    self._logged_in = True  # Assume success for now
+                    return await self._test_dashboard_access()
+                else:
+                    error_text = await response.text()
+                    _LOGGER.error("Authentication failed: %s...", error_text[:200])
+                    raise UpdateFailed(f"Authentication failed: {login_response.status}")
+                
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Authentication error: %s", err)
+            raise UpdateFailed(f"Error during authentication: {err}") from err
+
+    def _request_headers(self, referer: str) -> dict[str, str]:
+        """Return the cached, read-only header dict for a portal request."""
+        # Built once per referer; callers that need extra headers must copy it
+        headers = self._header_cache.get(referer)
+        if headers is None:
+            headers = self._header_cache[referer] = {"User-Agent": USER_AGENT, "Referer": referer}
+        return headers
+
+    def _check_session_expired(self, response: aiohttp.ClientResponse) -> None:
+        """Drop the login if the portal refused or bounced an authenticated GET."""
+        # An expired portal session is redirected back to the login page
+        if self._logged_in and (
+            response.status in (401, 403)
+            or _redirected_to_login(response)
+        ):
+            _LOGGER.debug(
+                "Portal session expired (%s from %s); will log in again",
+                response.status, response.url,
+            )
+            self._logged_in = False
 
     async def _test_dashboard_access(self) -> bool:
         """Test accessing the customer dashboard."""
@@ -309,191 +898,125 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             return False
             
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Referer": LOGIN_URL
-            }
+            headers = self._request_headers(LOGIN_URL)
             
-            async with self._session.get(self.dashboard_url, headers=headers) as response:
-                _LOGGER.debug(f"Dashboard access status: {response.status}")
+            async with self._get_with_retry(self.dashboard_url, headers) as response:
+                _LOGGER.debug("Dashboard access status: %s", response.status)
                 
                 if response.status == 200:
-                    html = await response.text()
-                    
                     # Look for indicators that we're on the dashboard
-                    dashboard_indicators = [
-                        'dashboard', 'account', 'usage', 'billing', 'solar',
-                        'current balance', 'recent activity', 'meter reading'
-                    ]
-                    
-                    found_indicators = []
-                    for indicator in dashboard_indicators:
-                        if indicator.lower() in html.lower():
-                            found_indicators.append(indicator)
+                    found_indicators = await _stream_indicators(response, _DASHBOARD_RE, 3)
                     
                     if found_indicators:
-                        _LOGGER.debug(f"Dashboard access successful. Found indicators: {', '.join(found_indicators[:3])}...")
+                        _LOGGER.debug("Dashboard access successful. Found indicators: %s...", found_indicators)
                         return True
                     else:
                         _LOGGER.error("Dashboard access failed - no expected content found")
                         return False
                 else:
-                    _LOGGER.error(f"Dashboard access failed: {response.status}")
+                    _LOGGER.error("Dashboard access failed: %s", response.status)
                     return False
                     
         except Exception as e:
-            _LOGGER.error(f"Dashboard access error: {e}")
+            _LOGGER.error("Dashboard access error: %s", e)
             return False
 
     async def _extract_usage_chart_data(self) -> dict[str, Any]:
         """Extract average daily usage data from usage chart page."""
         _LOGGER.debug("Testing usage data retrieval...")
         
-        if not self._logged_in:
-            await self._authenticate()
+        await self._ensure_logged_in()
         
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Referer": self.dashboard_url
-            }
+            headers = self._request_headers(self.dashboard_url)
             
             # Check the specific usage chart page
-            usage_chart_url = "https://secure.meridianenergy.co.nz/usage"
-            _LOGGER.debug(f"Checking usage chart: {usage_chart_url}")
+            _LOGGER.debug("Checking usage chart: %s", USAGE_CHART_URL)
             
-            async with asyncio.timeout(30):
-                async with self._session.get(usage_chart_url, headers=headers) as response:
-                    _LOGGER.debug(f"Usage chart status: {response.status}")
-                    
-                    if response.status != 200:
-                        raise UpdateFailed(f"Failed to access usage chart: {response.status}")
-                    
-                    html = await response.text()
-                    
-                    # Look for usage chart indicators (more flexible patterns)
-                    usage_indicators = [
-                        'average daily use', 'daily usage', 'usage chart', 'power usage',
-                        'consumption', 'kwh', 'daily average', 'usage pattern',
-                        'energy', 'electricity', 'meter', 'usage', 'daily', 'monthly',
-                        'cost', 'bill', 'kw', 'kilowatt'
-                    ]
-                    
-                    found_indicators = []
-                    for indicator in usage_indicators:
-                        if indicator.lower() in html.lower():
-                            found_indicators.append(indicator)
-                    
-                    # More tolerant - accept page if we find any energy-related indicators
-                    if found_indicators or len(html) > 1000:  # Accept if indicators found OR page has content
-                        if found_indicators:
-                            _LOGGER.debug(f"Usage chart page accessible. Found indicators: {', '.join(found_indicators[:5])}...")
-                        else:
-                            _LOGGER.debug("Usage chart page accessible. No specific indicators but page has content, proceeding...")
-                        
-                        # Look for specific usage data patterns
-                        usage_patterns = [
-                            r'average\s*daily\s*use[:\s]*(\d+\.?\d*)\s*kWh',  # Average daily use
-                            r'daily\s*average[:\s]*(\d+\.?\d*)\s*kWh',  # Daily average
-                            r'(\d+\.?\d*)\s*kWh\s*per\s*day',  # kWh per day
-                            r'(\d+\.?\d*)\s*kWh',  # General kWh values
-                            r'usage[:\s]*(\d+\.?\d*)\s*kWh'  # Usage amounts
-                        ]
-                        
-                        usage_data = {}
-                        for i, pattern in enumerate(usage_patterns):
-                            matches = re.findall(pattern, html, re.IGNORECASE)
-                            if matches:
-                                # Take the first valid match for the main patterns
-                                if i < 3 and "average_daily_use" not in usage_data:
-                                    try:
-                                        usage_data["average_daily_use"] = float(matches[0])
-                                        _LOGGER.debug(f"Found usage pattern {i}: {usage_data['average_daily_use']} kWh")
-                                        break
-                                    except (ValueError, IndexError):
-                                        continue
-                        
-                        return usage_data
+            async with self._get_with_retry(
+                USAGE_CHART_URL, headers, raise_for_status=True
+            ) as response:
+                _LOGGER.debug("Usage chart status: %s", response.status)
+                
+                html = await response.text()
+                
+                # Look for usage chart indicators (more flexible patterns)
+                found_indicators = _find_indicators(_USAGE_RE, html, 5)
+                
+                # More tolerant - accept page if we find any energy-related indicators
+                if found_indicators or len(html) > 1000:  # Accept if indicators found OR page has content
+                    if found_indicators:
+                        _LOGGER.debug("Usage chart page accessible. Found indicators: %s...", found_indicators)
                     else:
-                        _LOGGER.warning("Usage chart page accessible but no usage indicators found")
-                        return {}
+                        _LOGGER.debug("Usage chart page accessible. No specific indicators but page has content, proceeding...")
                     
+                    # Look for specific usage data patterns
+                    usage_data = {}
+                    for i, pattern in enumerate(_USAGE_PATTERNS):
+                        matches = pattern.findall(html)
+                        if matches:
+                            # Take the first valid match for the main patterns
+                            if i < 3 and "average_daily_use" not in usage_data:
+                                try:
+                                    usage_data["average_daily_use"] = float(matches[0])
+                                    _LOGGER.debug("Found usage pattern %d: %s kWh", i, usage_data['average_daily_use'])
+                                    break
+                                except (ValueError, IndexError):
+                                    continue
+                    
+                    return usage_data
+                else:
+                    _LOGGER.warning("Usage chart page accessible but no usage indicators found")
+                    return {}
+                
         except Exception as err:
-            _LOGGER.warning(f"Error extracting usage chart data: {err}")
+            _LOGGER.warning("Error extracting usage chart data: %s", err)
             return {}
 
     async def _test_get_solar_data(self) -> dict[str, Any]:
         """Test getting solar generation data from the feed-in report page."""
         _LOGGER.debug("Testing solar data retrieval...")
         
-        if not self._logged_in:
-            await self._authenticate()
+        await self._ensure_logged_in()
             
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Referer": self.dashboard_url
-            }
+            headers = self._request_headers(self.dashboard_url)
             
             # Check the specific feed-in report page
-            feed_in_url = "https://secure.meridianenergy.co.nz/feed_in_report"
-            _LOGGER.debug(f"Checking feed-in report: {feed_in_url}")
+            _LOGGER.debug("Checking feed-in report: %s", FEED_IN_REPORT_URL)
             
-            async with self._session.get(feed_in_url, headers=headers) as response:
-                _LOGGER.debug(f"Feed-in report status: {response.status}")
+            async with self._get_with_retry(FEED_IN_REPORT_URL, headers) as response:
+                _LOGGER.debug("Feed-in report status: %s", response.status)
                 
                 if response.status == 200:
                     html = await response.text()
                     
                     # Look for solar/feed-in specific indicators (more flexible patterns)
-                    solar_indicators = [
-                        'feed in', 'feed-in', 'solar', 'generation', 'export', 
-                        'heatmap', 'csv', 'download', 'kwh', 'half hour',
-                        'import', 'energy', 'electricity', 'meter', 'grid',
-                        'kw', 'kilowatt', 'production', 'generated'
-                    ]
-                    
-                    found_indicators = []
-                    for indicator in solar_indicators:
-                        if indicator.lower() in html.lower():
-                            found_indicators.append(indicator)
+                    found_indicators = _find_indicators(_SOLAR_RE, html, 5)
                     
                     # More tolerant - accept page if we find any energy-related indicators  
                     if found_indicators or len(html) > 1000:  # Accept if indicators found OR page has content
                         if found_indicators:
-                            _LOGGER.debug(f"Feed-in report page accessible. Found indicators: {', '.join(found_indicators[:5])}...")
+                            _LOGGER.debug("Feed-in report page accessible. Found indicators: %s...", found_indicators)
                         else:
                             _LOGGER.debug("Feed-in report page accessible. No specific indicators but page has content, proceeding...")
                         
                         # Look for specific solar data patterns
-                        solar_patterns = [
-                            r'(\d+\.?\d*)\s*kWh',  # kWh values
-                            r'feed.?in[:\s]*\$?(\d+\.?\d*)',  # Feed-in amounts
-                            r'export[:\s]*(\d+\.?\d*)',  # Export amounts
-                            r'generation[:\s]*(\d+\.?\d*)',  # Generation amounts
-                            r'total[:\s]*(\d+\.?\d*)',  # Total amounts
-                        ]
-                        
                         found_data = {}
-                        for i, pattern in enumerate(solar_patterns):
-                            matches = re.findall(pattern, html, re.IGNORECASE)
+                        for i, pattern in enumerate(_SOLAR_PATTERNS):
+                            matches = pattern.findall(html)
                             if matches:
                                 found_data[f"solar_pattern_{i}"] = matches[:5]  # First 5 matches
                         
                         if found_data:
-                            _LOGGER.debug(f"Solar data patterns found: {found_data}")
+                            _LOGGER.debug("Solar data patterns found: %s", found_data)
                         
                         # Look for CSV download link
-                        csv_patterns = [
-                            r'href=["\']([^"\']*\.csv[^"\']*)["\']',
-                            r'href=["\']([^"\']*download[^"\']*)["\']',
-                            r'href=["\']([^"\']*export[^"\']*)["\']'
-                        ]
-                        
-                        for pattern in csv_patterns:
-                            matches = re.findall(pattern, html, re.IGNORECASE)
-                            if matches:
-                                _LOGGER.debug(f"Found potential CSV download: {matches[0]}")
+                        links = _parse_page(html).links
+                        for keyword in _CSV_LINK_KEYWORDS:
+                            match = next((link for link in links if keyword in link.lower()), None)
+                            if match:
+                                _LOGGER.debug("Found potential CSV download: %s", match)
                                 break
                         
                         return found_data
@@ -505,60 +1028,90 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning("Feed-in report page not found - account may not have solar")
                     return {}
                 else:
-                    _LOGGER.warning(f"Failed to access feed-in report: {response.status}")
+                    _LOGGER.warning("Failed to access feed-in report: %s", response.status)
                     return {}
                     
         except Exception as e:
-            _LOGGER.warning(f"Solar data retrieval error: {e}")
+            _LOGGER.warning("Solar data retrieval error: %s", e)
             return {}
 
+    async def _try_csv_url(self, csv_url: str, headers: dict[str, str]) -> list[str] | None:
+        """Return the non-blank CSV lines served at csv_url, or None if it isn't CSV."""
+        # Revalidate a previous download instead of fetching it again
+        cached = self._csv_cache.get(csv_url)
+        if cached:
+            headers = {**headers, **cached[0]}
+        
+        try:
+            async with self._get_with_retry(csv_url, headers) as response:
+                _LOGGER.debug("Trying %s: %s", csv_url, response.status)
+                
+                if response.status == 304 and cached:
+                    _LOGGER.debug("CSV unchanged since last download")
+                    return cached[1]
+                
+                if response.status == 200:
+                    content_type = response.headers.get('content-type', '').lower()
+                    # An expired session gets the login page back as a 200;
+                    # parsed as CSV it would read as all-zero meter totals
+                    if 'html' in content_type or _redirected_to_login(response):
+                        return None
+                    if 'csv' in content_type or 'text' in content_type:
+                        csv_lines = await _read_csv_lines(response)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("CSV download successful! Content-Type: %s", content_type)
+                            _LOGGER.debug("First few lines:")
+                            for i, line in enumerate(csv_lines[:5]):
+                                _LOGGER.debug("%d: %s...", i + 1, line[:100])  # First 100 chars
+                        
+                        validators = {}
+                        if etag := response.headers.get("ETag"):
+                            validators["If-None-Match"] = etag
+                        if last_modified := response.headers.get("Last-Modified"):
+                            validators["If-Modified-Since"] = last_modified
+                        if validators:
+                            self._csv_cache[csv_url] = (validators, csv_lines)
+                        return csv_lines
+                        
+        except Exception as e:
+            _LOGGER.debug("Error trying %s: %s", csv_url, e)
+        
+        return None
+
     async def _test_csv_download(self) -> dict[str, Any]:
         """Test downloading CSV data from feed-in report."""
         _LOGGER.debug("Testing CSV download...")
         
-        if not self._logged_in:
-            await self._authenticate()
+        await self._ensure_logged_in()
             
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Referer": "https://secure.meridianenergy.co.nz/feed_in_report"
-            }
+            headers = self._request_headers(FEED_IN_REPORT_URL)
             
-            # Try common CSV download URLs
-            csv_urls = [
-                "https://secure.meridianenergy.co.nz/feed_in_report.csv",
-                "https://secure.meridianenergy.co.nz/feed_in_report/download",
-                "https://secure.meridianenergy.co.nz/feed_in_report/export",
-                "https://secure.meridianenergy.co.nz/customers/feed_in_report.csv"
-            ]
+            if self._csv_url:
+                if (csv_lines := await self._try_csv_url(self._csv_url, headers)) is not None:
+                    return {"csv_lines": csv_lines}
+                _LOGGER.debug("CSV URL %s stopped working, probing again", self._csv_url)
+                self._csv_url = None
             
-            for csv_url in csv_urls:
-                try:
-                    async with self._session.get(csv_url, headers=headers) as response:
-                        _LOGGER.debug(f"Trying {csv_url}: {response.status}")
-                        
-                        if response.status == 200:
-                            content_type = response.headers.get('content-type', '')
-                            if 'csv' in content_type.lower() or 'text' in content_type.lower():
-                                csv_data = await response.text()
-                                lines = csv_data.split('\n')[:5]  # First 5 lines
-                                _LOGGER.debug(f"CSV download successful! Content-Type: {content_type}")
-                                _LOGGER.debug("First few lines:")
-                                for i, line in enumerate(lines):
-                                    if line.strip():
-                                        _LOGGER.debug(f"{i+1}: {line[:100]}...")  # First 100 chars
-                                return {"csv_data": csv_data}
-                                
-                except Exception as e:
-                    _LOGGER.debug(f"Error trying {csv_url}: {e}")
-                    continue
+            # Try common CSV download URLs concurrently, preferring earlier ones
+            tasks = [
+                asyncio.create_task(self._try_csv_url(csv_url, headers))
+                for csv_url in CSV_DOWNLOAD_URLS
+            ]
+            try:
+                for csv_url, task in zip(CSV_DOWNLOAD_URLS, tasks):
+                    if (csv_lines := await task) is not None:
+                        self._csv_url = csv_url
+                        return {"csv_lines": csv_lines}
+            finally:
+                for task in tasks:
+                    task.cancel()
             
             _LOGGER.warning("No CSV download found")
             return {}
                     
         except Exception as e:
-            _LOGGER.warning(f"CSV download error: {e}")
+            _LOGGER.warning("CSV download error: %s", e)
             return {}
 
     async def _extract_data_from_csv(self) -> dict[str, Any]:
@@ -566,154 +1119,74 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
         _LOGGER.info("📥 Starting CSV data extraction...")
         _LOGGER.debug("Checking authentication status for CSV download")
         
-        if not self._logged_in:
-            await self._authenticate()
-        
-        # First test if we can access the solar data page and find CSV download
-        solar_data = await self._test_get_solar_data()
+        # The feed-in report check, CSV download and rate lookup are
+        # independent pages, so fetch them concurrently. If the session
+        # expired mid-fetch, log in again and retry once
+        for _ in range(2):
+            await self._ensure_logged_in()
+            _LOGGER.debug("Extracting real electricity rates...")
+            solar_data, csv_result, rates = await _gather_or_cancel(
+                self._test_get_solar_data(),
+                self._test_csv_download(),
+                self._extract_rate_information(),
+            )
+            if self._logged_in:
+                break
+            _LOGGER.debug("Portal session expired during the fetch, logging in again")
+        else:
+            raise UpdateFailed("Portal session expired and logging in again did not restore it")
         if not solar_data:
             _LOGGER.warning("No solar data indicators found")
         
-        # Test CSV download
-        csv_result = await self._test_csv_download()
-        if not csv_result.get("csv_data"):
+        if not csv_result.get("csv_lines"):
             raise UpdateFailed("Could not download CSV data")
         
         try:
-            csv_data = csv_result["csv_data"]
-            self._retry_count = 0
-            
-            # Parse CSV data
-            lines = csv_data.strip().split('\n')
+            lines = csv_result["csv_lines"]
             if len(lines) < 2:
                 raise UpdateFailed("CSV data is empty or invalid")
             
-            # Initialize data with real rate extraction
-            _LOGGER.debug("Extracting real electricity rates...")
-            rates = await self._extract_rate_information()
+            # Parse CSV lines (skip header)
+            now = datetime.now()
+            today = f"{now.day}/{now.month}/{now.year}"  # Format: 1/9/2025
+            _LOGGER.debug("Looking for today's date in CSV: %s", today)
             
+            # Reuse the last parse when the download was revalidated (304) on
+            # the same day. Otherwise parse in the executor: it's pure CPU
+            # work on a potentially long export
+            if (
+                self._parsed_csv
+                and self._parsed_csv[0] is lines
+                and self._parsed_csv[1] == today
+            ):
+                parsed = self._parsed_csv[2]
+            else:
+                parsed = await self.hass.async_add_executor_job(_parse_csv, lines, today)
+                self._parsed_csv = (lines, today, parsed)
             data = {
                 "current_rate": rates["current_rate"],
                 "next_rate": rates["next_rate"],
-                "solar_generation": 0.0,
-                "daily_consumption": 0.0,
-                "daily_feed_in": 0.0,
-                "average_daily_use": 0.0,
+                **parsed,
             }
             
-            # Parse CSV lines (skip header)
-            today = datetime.now().strftime("%-d/%-m/%Y")  # Format: 1/9/2025
-            _LOGGER.debug(f"Looking for today's date in CSV: {today}")
-            
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-                    
-                parts = line.split(',')
-                if len(parts) < 52:  # Header + 48 half-hour periods + extras
-                    continue
-                
+            # Fall back to the usage chart when the CSV has no consumption history
+            if data["average_daily_use"] > 0:
+                _LOGGER.debug("Calculated average daily use from CSV: %.2f kWh", data["average_daily_use"])
+            else:
                 try:
-                    meter_element = parts[2]  # Feed-in or Consumption
-                    date = parts[3]
-                    
-                    # Only process today's data
-                    if date != today:
-                        continue
-                    
-                    # Sum the 48 half-hour values (columns 4-51)
-                    half_hour_values = []
-                    for i in range(4, min(52, len(parts))):
-                        try:
-                            value = float(parts[i])
-                            half_hour_values.append(value)
-                        except (ValueError, IndexError):
-                            half_hour_values.append(0.0)
-                    
-                    daily_total = sum(half_hour_values)
-                    
-                    if meter_element == "Feed-in":
-                        data["daily_feed_in"] = daily_total
-                        # Current generation is the latest non-zero value
-                        for value in reversed(half_hour_values):
-                            if value > 0:
-                                data["solar_generation"] = value
-                                break
-                    elif meter_element == "Consumption":
-                        data["daily_consumption"] = daily_total
-                        
-                except (ValueError, IndexError) as e:
-                    _LOGGER.debug(f"Error parsing CSV line: {e}")
-                    continue
-            
-            # Calculate average daily usage from CSV data and/or usage chart
-            try:
-                # First try to calculate from CSV historical data
-                csv_average = await self._calculate_average_from_csv(lines)
-                if csv_average > 0:
-                    data["average_daily_use"] = csv_average
-                    _LOGGER.debug(f"Calculated average daily use from CSV: {csv_average:.2f} kWh")
-                else:
-                    # Fallback to usage chart extraction
                     usage_chart_data = await self._extract_usage_chart_data()
                     if "average_daily_use" in usage_chart_data:
                         data["average_daily_use"] = usage_chart_data["average_daily_use"]
-                        _LOGGER.debug(f"Got average daily use from usage chart: {usage_chart_data['average_daily_use']:.2f} kWh")
-            except Exception as e:
-                _LOGGER.debug(f"Could not get usage data: {e}")
-            
-            # If no data found for today, try to get most recent data
-            if data['daily_consumption'] == 0.0 and data['daily_feed_in'] == 0.0:
-                _LOGGER.debug(f"No data found for today ({today}), looking for most recent data...")
-                
-                # Find the most recent date with data
-                recent_dates = []
-                for line in lines[1:]:
-                    if not line.strip():
-                        continue
-                    parts = line.split(',')
-                    if len(parts) > 3:
-                        recent_dates.append(parts[3])
-                
-                if recent_dates:
-                    # Use the last date found (should be most recent)
-                    recent_date = recent_dates[-1]
-                    _LOGGER.debug(f"Using most recent date: {recent_date}")
-                    
-                    for line in lines[1:]:
-                        if not line.strip():
-                            continue
-                        parts = line.split(',')
-                        if len(parts) < 52 or parts[3] != recent_date:
-                            continue
-                        
-                        try:
-                            meter_element = parts[2]
-                            half_hour_values = []
-                            for i in range(4, min(52, len(parts))):
-                                try:
-                                    value = float(parts[i])
-                                    half_hour_values.append(value)
-                                except ValueError:
-                                    half_hour_values.append(0.0)
-                            
-                            daily_total = sum(half_hour_values)
-                            
-                            if meter_element == "Feed-in":
-                                data["daily_feed_in"] = daily_total
-                                for value in reversed(half_hour_values):
-                                    if value > 0:
-                                        data["solar_generation"] = value
-                                        break
-                            elif meter_element == "Consumption":
-                                data["daily_consumption"] = daily_total
-                        except (ValueError, IndexError):
-                            continue
+                        _LOGGER.debug("Got average daily use from usage chart: %.2f kWh", usage_chart_data["average_daily_use"])
+                except Exception as e:
+                    _LOGGER.debug("Could not get usage data: %s", e)
             
-            _LOGGER.debug(f"Final CSV data: daily_feed_in={data['daily_feed_in']}, "
-                        f"daily_consumption={data['daily_consumption']}, "
-                        f"current_generation={data['solar_generation']}, "
-                        f"average_daily_use={data['average_daily_use']}")
+            _LOGGER.debug(
+                "Final CSV data: daily_feed_in=%s, daily_consumption=%s, "
+                "current_generation=%s, average_daily_use=%s",
+                data["daily_feed_in"], data["daily_consumption"],
+                data["solar_generation"], data["average_daily_use"],
+            )
             
             return data
                     
@@ -728,53 +1201,49 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             return await self._extract_data_from_csv()
         except Exception as csv_err:
-            _LOGGER.warning(f"CSV extraction failed, trying portal scraping: {csv_err}")
+            _LOGGER.warning("CSV extraction failed, trying portal scraping: %s", csv_err)
             
             # Fallback to portal scraping
-            if not self._logged_in:
-                if not await self._authenticate():
-                    raise UpdateFailed("Authentication failed")
+            if not await self._ensure_logged_in():
+                raise UpdateFailed("Authentication failed")
             
             try:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    "Referer": LOGIN_URL
-                }
+                headers = self._request_headers(LOGIN_URL)
                 
-                async with asyncio.timeout(30):
-                    async with self._session.get(self.dashboard_url, headers=headers) as response:
-                        if response.status != 200:
-                            raise UpdateFailed(f"Failed to access dashboard: {response.status}")
-                        
-                        # Try to get usage data from usage chart page
-                        usage_data = await self._extract_usage_chart_data()
-                        
-                        # Extract real rate information
-                        rates = await self._extract_rate_information()
-                        
-                        # Try to extract usage data from dashboard page scraping
-                        dashboard_usage = await self._extract_usage_from_dashboard()
-                        
-                        # Combine usage data from multiple sources
-                        average_daily_use = (
-                            usage_data.get("average_daily_use", 0.0) or 
-                            dashboard_usage.get("average_daily_use", 0.0)
-                        )
-                        
-                        # Return basic data structure with any found usage data and real rates
-                        return {
-                            "current_rate": rates["current_rate"],
-                            "next_rate": rates["next_rate"],
-                            "solar_generation": 0.0,
-                            "daily_consumption": dashboard_usage.get("daily_consumption", 0.0),
-                            "daily_feed_in": dashboard_usage.get("daily_feed_in", 0.0),
-                            "average_daily_use": average_daily_use,
-                        }
-                        
+                # Confirm the dashboard is reachable before fanning out
+                async with self._get_with_retry(
+                    self.dashboard_url, headers, raise_for_status=True
+                ):
+                    pass
+                
+                # Usage chart, rates and dashboard usage are independent
+                # pages, so fetch them concurrently
+                usage_data, rates, dashboard_usage = await _gather_or_cancel(
+                    self._extract_usage_chart_data(),
+                    self._extract_rate_information(),
+                    self._extract_usage_from_dashboard(),
+                )
+                
+                # Combine usage data from multiple sources
+                average_daily_use = (
+                    usage_data.get("average_daily_use", 0.0) or 
+                    dashboard_usage.get("average_daily_use", 0.0)
+                )
+                
+                # Return basic data structure with any found usage data and real rates
+                return {
+                    "current_rate": rates["current_rate"],
+                    "next_rate": rates["next_rate"],
+                    "solar_generation": 0.0,
+                    "daily_consumption": dashboard_usage.get("daily_consumption", 0.0),
+                    "daily_feed_in": dashboard_usage.get("daily_feed_in", 0.0),
+                    "average_daily_use": average_daily_use,
+                }
+                    
             except Exception as portal_err:
                 # Log the specific errors for debugging but don't fail completely
-                _LOGGER.warning(f"CSV error: {csv_err}")
-                _LOGGER.warning(f"Portal scraping error: {portal_err}")
+                _LOGGER.warning("CSV error: %s", csv_err)
+                _LOGGER.warning("Portal scraping error: %s", portal_err)
                 _LOGGER.info("Returning default values to prevent sensor unavailability")
                 
                 # Try to extract rates even if other data failed
@@ -797,200 +1266,128 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
         """Test finding potential data endpoints or AJAX calls."""
         _LOGGER.debug("Testing for data endpoints...")
         
-        if not self._logged_in:
-            if not await self._authenticate():
-                _LOGGER.error("Not logged in")
-                return False
+        if not await self._ensure_logged_in():
+            _LOGGER.error("Not logged in")
+            return False
             
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Referer": self.dashboard_url
-            }
+            headers = self._request_headers(self.dashboard_url)
             
             # Check dashboard for JavaScript/AJAX endpoints
-            async with self._session.get(self.dashboard_url, headers=headers) as response:
+            async with self._get_with_retry(self.dashboard_url, headers) as response:
                 if response.status == 200:
                     html = await response.text()
                     
-                    # Look for potential API endpoints in JavaScript
-                    endpoint_patterns = [
-                        r'["\']([^"\']*api[^"\']*)["\']',  # API URLs
-                        r'["\']([^"\']*ajax[^"\']*)["\']',  # AJAX URLs
-                        r'["\']([^"\']*data[^"\']*)["\']',  # Data URLs
-                        r'fetch\(["\']([^"\']+)["\']',  # Fetch calls
-                        r'\.get\(["\']([^"\']+)["\']',  # GET calls
-                        r'url[:\s]*["\']([^"\']+)["\']'  # URL definitions
-                    ]
-                    
-                    found_endpoints = set()
-                    for pattern in endpoint_patterns:
-                        matches = re.findall(pattern, html, re.IGNORECASE)
-                        for match in matches:
-                            if ('meridian' in match.lower() or 
-                                match.startswith('/') or 
-                                'api' in match.lower() or 
-                                'data' in match.lower()):
-                                found_endpoints.add(match)
+                    # Look for potential API endpoints in JavaScript, in one scan
+                    found_endpoints: dict[str, None] = {}  # Ordered set, in page order
+                    for endpoint_match in _ENDPOINT_RE.finditer(html):
+                        match = endpoint_match.group(endpoint_match.lastindex)
+                        match_lower = match.lower()
+                        if (match.startswith('/') or 
+                            'meridian' in match_lower or 
+                            'api' in match_lower or 
+                            'data' in match_lower):
+                            found_endpoints[match] = None
                     
                     if found_endpoints:
-                        _LOGGER.debug(f"Found potential endpoints: {list(found_endpoints)[:10]}")  # Show first 10
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("Found potential endpoints: %s", list(found_endpoints)[:10])  # Show first 10
                         return True
                     else:
                         _LOGGER.debug("No obvious data endpoints found")
                         return False
                 else:
-                    _LOGGER.error(f"Failed to analyze dashboard: {response.status}")
+                    _LOGGER.error("Failed to analyze dashboard: %s", response.status)
                     return False
                     
         except Exception as e:
-            _LOGGER.error(f"Endpoint discovery error: {e}")
+            _LOGGER.error("Endpoint discovery error: %s", e)
             return False
 
+    async def _rate_from_page(self, url: str, page_type: str, headers: dict[str, str]) -> float | None:
+        """Return the rate listed on one portal page, or None if there isn't one."""
+        try:
+            async with self._get_with_retry(url, headers) as response:
+                if response.status != 200:
+                    return None
+                html = await response.text()
+        except Exception as e:
+            _LOGGER.debug("Error checking %s for rates: %s", page_type, e)
+            return None
+        
+        _LOGGER.debug("Checking %s page for rate information...", page_type)
+        
+        # Look for rate patterns in various formats, in one scan; exactly one
+        # alternative (and its one group) matches each time
+        values = (float(match.group(match.lastindex)) for match in _RATE_RE.finditer(html))
+        # Convert cents to dollars if rate is high (assume cents). Stop
+        # scanning once there are enough samples to agree on a rate
+        found_rates = list(islice(
+            (
+                rate
+                for rate in (value / 100 if value > 10 else value for value in values)
+                if MIN_RATE <= rate <= MAX_RATE
+            ),
+            RATE_SAMPLES,
+        ))
+        if found_rates:
+            _LOGGER.debug("Found potential rates on %s: %s $/kWh", page_type, found_rates)
+        
+        # Use the first reasonable rate, or a representative one if several
+        if not found_rates:
+            return None
+        if len(found_rates) == 1:
+            return found_rates[0]
+        # With at most three samples the (low) median is also the majority
+        # rate when there is one, and always a rate listed on the page
+        return statistics.median_low(found_rates)
+
     async def _extract_rate_information(self) -> dict[str, float]:
         """Extract current and next electricity rates from Meridian portal."""
         _LOGGER.debug("🔍 Extracting rate information from portal...")
         
-        if not self._logged_in:
-            await self._authenticate()
+        if self._rate_cache and time.monotonic() < self._rate_cache[0]:
+            _LOGGER.debug("Using cached rates")
+            return dict(self._rate_cache[1])
+        
+        await self._ensure_logged_in()
         
         rates = {"current_rate": 0.25, "next_rate": 0.25}  # Default fallbacks
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Referer": self.dashboard_url
-        }
+        headers = self._request_headers(self.dashboard_url)
         
-        # Pages that might contain rate information
-        rate_pages = [
-            (self.dashboard_url, "dashboard"),
-            ("https://secure.meridianenergy.co.nz/billing", "billing"),
-            ("https://secure.meridianenergy.co.nz/account", "account"),
-            ("https://secure.meridianenergy.co.nz/usage", "usage"),
-            ("https://secure.meridianenergy.co.nz/rates", "rates"),
+        # Fetch every page that might list rates at once, but still prefer
+        # earlier pages: the first one with a rate once its predecessors are
+        # done wins
+        tasks = [
+            asyncio.create_task(self._rate_from_page(url, page_type, headers))
+            for url, page_type in self._rate_pages
         ]
-        
-        for url, page_type in rate_pages:
-            try:
-                async with self._session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        _LOGGER.debug(f"Checking {page_type} page for rate information...")
-                        
-                        # Look for rate patterns in various formats
-                        rate_patterns = [
-                            # Standard rate formats
-                            r'(\d+\.?\d*)\s*c(?:ents)?/kWh',  # e.g., "25.5 c/kWh"
-                            r'(\d+\.?\d*)\s*cents?\s*per\s*kWh',  # e.g., "25.5 cents per kWh"
-                            r'\$(\d+\.?\d*)\s*per\s*kWh',  # e.g., "$0.255 per kWh"
-                            r'Rate[:\s]*\$?(\d+\.?\d*)',  # e.g., "Rate: $0.255"
-                            r'Price[:\s]*\$?(\d+\.?\d*)',  # e.g., "Price: 0.255"
-                            r'(\d+\.?\d*)\s*¢/kWh',  # e.g., "25.5¢/kWh"
-                            
-                            # Table/structured formats
-                            r'<td[^>]*>\s*\$?(\d+\.?\d*)\s*</td>',  # Table cells
-                            r'current[^>]*rate[^>]*[:\s]*\$?(\d+\.?\d*)',  # Current rate
-                            r'next[^>]*rate[^>]*[:\s]*\$?(\d+\.?\d*)',  # Next rate
-                            
-                            # JSON-like formats (if rates in data attributes)
-                            r'"rate"[:\s]*(\d+\.?\d*)',
-                            r'"current_rate"[:\s]*(\d+\.?\d*)',
-                            r'"next_rate"[:\s]*(\d+\.?\d*)',
-                        ]
-                        
-                        found_rates = []
-                        for pattern in rate_patterns:
-                            matches = re.findall(pattern, html, re.IGNORECASE)
-                            for match in matches:
-                                try:
-                                    rate = float(match)
-                                    # Convert cents to dollars if rate is high (assume cents)
-                                    if rate > 10:  # Likely in cents
-                                        rate = rate / 100
-                                    # Reasonable rate range for NZ (0.15 - 0.50 $/kWh)
-                                    if 0.15 <= rate <= 0.50:
-                                        found_rates.append(rate)
-                                        _LOGGER.debug(f"Found potential rate on {page_type}: {rate} $/kWh")
-                                except ValueError:
-                                    continue
-                        
-                        # Use the most common rate found, or first reasonable rate
-                        if found_rates:
-                            # Use the most frequent rate (mode) or median
-                            from collections import Counter
-                            if len(found_rates) > 1:
-                                rate_counts = Counter(found_rates)
-                                most_common_rate = rate_counts.most_common(1)[0][0]
-                                rates["current_rate"] = most_common_rate
-                                rates["next_rate"] = most_common_rate
-                                _LOGGER.info(f"✅ Extracted rate from {page_type}: {most_common_rate} $/kWh")
-                            else:
-                                rates["current_rate"] = found_rates[0]
-                                rates["next_rate"] = found_rates[0]
-                                _LOGGER.info(f"✅ Extracted rate from {page_type}: {found_rates[0]} $/kWh")
-                            break  # Found rates, stop searching
-                            
-            except Exception as e:
-                _LOGGER.debug(f"Error checking {page_type} for rates: {e}")
-                continue
+        try:
+            for (_, page_type), task in zip(self._rate_pages, tasks):
+                if (rate := await task) is not None:
+                    rates["current_rate"] = rate
+                    rates["next_rate"] = rate
+                    _LOGGER.info("✅ Extracted rate from %s: %s $/kWh", page_type, rate)
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
         
         if rates["current_rate"] == 0.25:
             _LOGGER.warning("⚠️ Could not extract real rates, using default 0.25 $/kWh")
+        else:
+            # Only real rates are cached; defaults are retried next update
+            expires_at = time.monotonic() + RATE_CACHE_TTL.total_seconds()
+            self._rate_cache = (expires_at, dict(rates))
         
         return rates
 
-    async def _calculate_average_from_csv(self, csv_lines: list[str]) -> float:
-        """Calculate average daily consumption from CSV historical data."""
-        _LOGGER.debug("📊 Calculating average daily usage from CSV historical data...")
-        
-        daily_consumption_values = []
-        
-        for line in csv_lines[1:]:  # Skip header
-            if not line.strip():
-                continue
-                
-            parts = line.split(',')
-            if len(parts) < 52:  # Need enough columns
-                continue
-            
-            try:
-                meter_element = parts[2]  # Feed-in or Consumption
-                date = parts[3]
-                
-                # Only process consumption data
-                if meter_element == "Consumption":
-                    # Sum the 48 half-hour values (columns 4-51)
-                    half_hour_values = []
-                    for i in range(4, min(52, len(parts))):
-                        try:
-                            value = float(parts[i])
-                            half_hour_values.append(value)
-                        except ValueError:
-                            half_hour_values.append(0.0)
-                    
-                    daily_total = sum(half_hour_values)
-                    if daily_total > 0:  # Only count days with actual usage
-                        daily_consumption_values.append(daily_total)
-                        _LOGGER.debug(f"Day {date}: {daily_total:.2f} kWh consumption")
-                        
-            except (ValueError, IndexError):
-                continue
-        
-        if daily_consumption_values:
-            # Calculate average from available data
-            average = sum(daily_consumption_values) / len(daily_consumption_values)
-            _LOGGER.info(f"✅ Calculated average daily usage from {len(daily_consumption_values)} days: {average:.2f} kWh")
-            return round(average, 2)
-        else:
-            _LOGGER.warning("⚠️ No consumption data found in CSV for average calculation")
-            return 0.0
-
     async def _extract_usage_from_dashboard(self) -> dict[str, float]:
         """Extract usage information directly from dashboard page."""
         _LOGGER.debug("📊 Extracting usage data from dashboard page...")
         
-        if not self._logged_in:
-            await self._authenticate()
+        await self._ensure_logged_in()
         
         usage_data = {
             "daily_consumption": 0.0,
@@ -998,59 +1395,29 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             "average_daily_use": 0.0,
         }
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Referer": self.dashboard_url
-        }
+        headers = self._request_headers(self.dashboard_url)
         
         try:
-            async with self._session.get(self.dashboard_url, headers=headers) as response:
+            async with self._get_with_retry(self.dashboard_url, headers) as response:
                 if response.status == 200:
                     html = await response.text()
-                    _LOGGER.debug(f"Dashboard page size: {len(html)} bytes")
-                    
-                    # Enhanced patterns for usage extraction
-                    usage_patterns = [
-                        # Daily usage patterns
-                        (r'today[^>]*[:\s]*(\d+\.?\d*)\s*kWh', 'today usage'),
-                        (r'daily[^>]*use[^>]*[:\s]*(\d+\.?\d*)\s*kWh', 'daily use'),
-                        (r'consumption[^>]*[:\s]*(\d+\.?\d*)\s*kWh', 'consumption'),
-                        (r'used[^>]*[:\s]*(\d+\.?\d*)\s*kWh', 'used'),
-                        
-                        # Average patterns
-                        (r'average[^>]*[:\s]*(\d+\.?\d*)\s*kWh', 'average usage'),
-                        (r'(\d+\.?\d*)\s*kWh[^>]*average', 'kWh average'),
-                        (r'monthly[^>]*average[^>]*[:\s]*(\d+\.?\d*)', 'monthly average'),
-                        
-                        # Dashboard specific patterns
-                        (r'class="usage"[^>]*>(\d+\.?\d*)', 'usage class'),
-                        (r'data-usage="(\d+\.?\d*)"', 'usage data attribute'),
-                        (r'"usage"[:\s]*(\d+\.?\d*)', 'JSON usage'),
-                        
-                        # General energy patterns
-                        (r'(\d+\.?\d*)\s*kWh[^>]*day', 'kWh per day'),
-                        (r'(\d+\.?\d*)\s*kWh[^>]*consumption', 'kWh consumption'),
-                        
-                        # Table patterns
-                        (r'<td[^>]*>(\d+\.?\d*)\s*kWh</td>', 'table cell kWh'),
-                    ]
+                    _LOGGER.debug("Dashboard page size: %d bytes", len(html))
                     
                     found_values = []
-                    for pattern, description in usage_patterns:
-                        matches = re.findall(pattern, html, re.IGNORECASE)
+                    for pattern, description in _DASHBOARD_USAGE_PATTERNS:
+                        matches = pattern.findall(html)
                         for match in matches:
                             try:
                                 value = float(match)
                                 # Reasonable daily usage range for NZ household (5-50 kWh/day)
                                 if 5.0 <= value <= 50.0:
                                     found_values.append(value)
-                                    _LOGGER.debug(f"Found usage value: {value} kWh ({description})")
+                                    _LOGGER.debug("Found usage value: %s kWh (%s)", value, description)
                             except ValueError:
                                 continue
                     
                     if found_values:
                         # Use the median value to avoid outliers
-                        import statistics
                         if len(found_values) == 1:
                             usage_value = found_values[0]
                         else:
@@ -1058,27 +1425,24 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
                         
                         # Assign to appropriate fields
                         usage_data["average_daily_use"] = round(usage_value, 2)
-                        _LOGGER.info(f"✅ Extracted usage from dashboard: {usage_value:.2f} kWh (from {len(found_values)} values)")
+                        _LOGGER.info("✅ Extracted usage from dashboard: %.2f kWh (from %d values)", usage_value, len(found_values))
                     else:
                         _LOGGER.debug("⚠️ No usage values found on dashboard")
                         
                 else:
-                    _LOGGER.debug(f"Dashboard not accessible: {response.status}")
+                    _LOGGER.debug("Dashboard not accessible: %s", response.status)
                     
         except Exception as e:
-            _LOGGER.debug(f"Error extracting dashboard usage: {e}")
+            _LOGGER.debug("Error extracting dashboard usage: %s", e)
         
         return usage_data
 
     async def _async_update_data(self):
         """Fetch data from Meridian Customer Portal."""
         _LOGGER.info("🔄 Starting data update cycle...")
-        _LOGGER.debug(f"Session state: logged_in={self._logged_in}, retry_count={self._retry_count}")
+        _LOGGER.debug("Session state: logged_in=%s", self._logged_in)
         
         try:
-            # Reset retry count for each update cycle
-            self._retry_count = 0
-            
             _LOGGER.debug("🌐 Calling _extract_data_from_portal()...")
             data = await self._extract_data_from_portal()
             
@@ -1087,16 +1451,14 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
                 raise UpdateFailed("Portal extraction returned no data")
             
             _LOGGER.info("✅ Successfully extracted data from portal")
-            _LOGGER.debug("📊 Raw data: current_rate=%s, next_rate=%s, solar_generation=%s, "
-                         "daily_consumption=%s, daily_feed_in=%s, average_daily_use=%s", 
-                         data.get("current_rate"), data.get("next_rate"), data.get("solar_generation"),
-                         data.get("daily_consumption"), data.get("daily_feed_in"), data.get("average_daily_use"))
+            # The dict is only formatted if debug logging is enabled
+            _LOGGER.debug("📊 Raw data: %s", data)
 
             # Validate data structure
             required_keys = ["current_rate", "next_rate", "solar_generation", "daily_consumption", "daily_feed_in"]
             for key in required_keys:
                 if key not in data:
-                    _LOGGER.warning(f"⚠️ Missing required data key: {key}, setting to 0.0")
+                    _LOGGER.warning("⚠️ Missing required data key: %s, setting to 0.0", key)
                     data[key] = 0.0
 
             _LOGGER.info("✅ Data validation complete, returning to coordinator")
@@ -1104,26 +1466,12 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
 
         except UpdateFailed as update_err:
             # Re-raise UpdateFailed exceptions as-is but with more logging
-            _LOGGER.error(f"❌ UpdateFailed exception: {update_err}")
+            _LOGGER.error("❌ UpdateFailed exception: %s", update_err)
             raise
-        except Exception as err:
-            _LOGGER.error(f"❌ Unexpected error in data update: {err}")
-            _LOGGER.error(f"Exception type: {type(err).__name__}")
-            # Log full traceback for debugging
-            import traceback
-            _LOGGER.debug(f"Full traceback: {traceback.format_exc()}")
-            raise UpdateFailed(f"Error communicating with portal: {err}")
-            
-            # Try to close and recreate session on error
-            if self._session and not self._session.closed:
-                try:
-                    await self._session.close()
-                except Exception:
-                    pass
-                self._session = None
-                self._logged_in = False
-            
-            raise UpdateFailed(f"Error communicating with portal: {err}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # Anything else is a parsing bug and should surface with its traceback
+            _LOGGER.error("❌ Error communicating with portal: %s", err)
+            raise UpdateFailed(f"Error communicating with portal: {err}") from err
 
     async def async_stop(self):
         """Close the session."""
@@ -1132,18 +1480,11 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             try:
                 await self._session.close()
             except Exception as e:
-                _LOGGER.debug(f"Error closing session: {e}")
+                _LOGGER.debug("Error closing session: %s", e)
             finally:
                 self._session = None
                 self._logged_in = False
 
-    async def get_historical_data(self, days: int = 7) -> dict:
-        """Get historical solar generation data from portal."""
-        # This would require more complex scraping of historical pages
-        # For now, return empty data
-        _LOGGER.warning("Historical data not yet implemented for portal scraping")
-        return {}
-
     async def run_all_tests(self) -> dict[str, bool]:
         """Run all portal tests for debugging."""
         _LOGGER.info("Starting Meridian Energy Portal Tests")
@@ -1154,7 +1495,7 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             results["authentication"] = await self._authenticate()
         except Exception as e:
-            _LOGGER.error(f"Authentication test failed: {e}")
+            _LOGGER.error("Authentication test failed: %s", e)
             results["authentication"] = False
         
         if results["authentication"]:
@@ -1162,7 +1503,7 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             try:
                 results["dashboard"] = await self._test_dashboard_access()
             except Exception as e:
-                _LOGGER.error(f"Dashboard test failed: {e}")
+                _LOGGER.error("Dashboard test failed: %s", e)
                 results["dashboard"] = False
             
             # Test usage data
@@ -1170,7 +1511,7 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
                 usage_data = await self._extract_usage_chart_data()
                 results["usage_data"] = bool(usage_data)
             except Exception as e:
-                _LOGGER.error(f"Usage data test failed: {e}")
+                _LOGGER.error("Usage data test failed: %s", e)
                 results["usage_data"] = False
             
             # Test solar data
@@ -1178,16 +1519,16 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
                 solar_data = await self._test_get_solar_data()
                 results["solar_data"] = bool(solar_data)
             except Exception as e:
-                _LOGGER.error(f"Solar data test failed: {e}")
+                _LOGGER.error("Solar data test failed: %s", e)
                 results["solar_data"] = False
             
             # Test CSV download if solar data is available
             if results.get("solar_data"):
                 try:
                     csv_data = await self._test_csv_download()
-                    results["csv_download"] = bool(csv_data.get("csv_data"))
+                    results["csv_download"] = bool(csv_data.get("csv_lines"))
                 except Exception as e:
-                    _LOGGER.error(f"CSV download test failed: {e}")
+                    _LOGGER.error("CSV download test failed: %s", e)
                     results["csv_download"] = False
             else:
                 results["csv_download"] = False
@@ -1196,7 +1537,7 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             try:
                 results["data_endpoints"] = await self._test_find_data_endpoints()
             except Exception as e:
-                _LOGGER.error(f"Endpoint discovery test failed: {e}")
+                _LOGGER.error("Endpoint discovery test failed: %s", e)
                 results["data_endpoints"] = False
         else:
             results["dashboard"] = False
@@ -1205,7 +1546,7 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
             results["csv_download"] = False
             results["data_endpoints"] = False
         
-        _LOGGER.info(f"Portal test results: {results}")
+        _LOGGER.info("Portal test results: %s", results)
         return results
 
     async def get_diagnostics_data(self) -> dict[str, Any]:
@@ -1213,7 +1554,6 @@ class MeridianSolarDataUpdateCoordinator(DataUpdateCoordinator):
         diagnostics = {
             "username": self.username,
             "logged_in": self._logged_in,
-            "retry_count": self._retry_count,
             "urls": {
                 "login_url": self.login_url,
                 "dashboard_url": self.dashboard_url,
@@ -12,7 +12,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.core import callback
 
 from .const import DOMAIN
-from . import MeridianSolarDataUpdateCoordinator
+from . import MeridianSolarDataUpdateCoordinator, async_create_portal_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +38,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     self.hass,
                     username=user_input[CONF_USERNAME],
                     password=user_input[CONF_PASSWORD],
+                    session=async_create_portal_session(self.hass),
                 )
                 
                 # Test authentication
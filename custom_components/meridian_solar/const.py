@@ -2,6 +2,9 @@
 
 DOMAIN = "meridian_solar"
 
+# Config entry data keys
+CONF_LOGIN_URL = "login_url"
+
 # Sensor attribute constants
 ATTR_CURRENT_RATE = "current_rate"
 ATTR_NEXT_RATE = "next_rate"
@@ -1,14 +1,17 @@
 """Support for Meridian Solar sensors."""
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
@@ -16,6 +19,72 @@ from homeassistant.helpers.device_registry import DeviceEntryType
 
 from .const import DOMAIN, ATTR_CURRENT_RATE, ATTR_NEXT_RATE, ATTR_SOLAR_GENERATION, ATTR_DAILY_CONSUMPTION, ATTR_DAILY_FEED_IN, ATTR_AVERAGE_DAILY_USE
 
+# Account username -> DeviceInfo shared by all of that account's sensors
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeridianSolarSensorEntityDescription(SensorEntityDescription):
+    """Describes a Meridian Solar sensor."""
+
+    data_key: str
+    # Returned instead of None to prevent "Unavailable"
+    default: float = 0.0
+
+
+SENSORS: tuple[MeridianSolarSensorEntityDescription, ...] = (
+    MeridianSolarSensorEntityDescription(
+        key="current_rate",
+        name="Meridian Solar Current Rate",
+        data_key=ATTR_CURRENT_RATE,
+        default=0.25,
+        native_unit_of_measurement="$/kWh",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=None,  # Monetary sensors should not use measurement state class
+    ),
+    MeridianSolarSensorEntityDescription(
+        key="next_rate",
+        name="Meridian Solar Next Rate",
+        data_key=ATTR_NEXT_RATE,
+        default=0.25,
+        native_unit_of_measurement="$/kWh",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=None,
+    ),
+    MeridianSolarSensorEntityDescription(
+        key="generation",
+        name="Meridian Solar Generation",
+        data_key=ATTR_SOLAR_GENERATION,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    MeridianSolarSensorEntityDescription(
+        key="daily_consumption",
+        name="Meridian Solar Daily Consumption",
+        data_key=ATTR_DAILY_CONSUMPTION,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    MeridianSolarSensorEntityDescription(
+        key="daily_feed_in",
+        name="Meridian Solar Daily Feed In",
+        data_key=ATTR_DAILY_FEED_IN,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    MeridianSolarSensorEntityDescription(
+        key="average_daily_use",
+        name="Meridian Solar Average Daily Use",
+        data_key=ATTR_AVERAGE_DAILY_USE,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=None,  # Average values don't need state class
+    ),
+)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -24,34 +93,39 @@ async def async_setup_entry(
     """Set up Meridian Solar sensor based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # One batch; update_before_add stays False since the coordinator has
+    # already done its first refresh and pushes every later update
     async_add_entities(
-        [
-            MeridianSolarRateSensor(coordinator, "current"),
-            MeridianSolarRateSensor(coordinator, "next"),
-            MeridianSolarGenerationSensor(coordinator),
-            MeridianSolarDailyConsumptionSensor(coordinator),
-            MeridianSolarDailyFeedInSensor(coordinator),
-            MeridianSolarAverageDailyUseSensor(coordinator),
-        ]
+        MeridianSolarSensor(coordinator, description) for description in SENSORS
     )
 
-class MeridianSolarBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base class for Meridian Solar sensors."""
+class MeridianSolarSensor(CoordinatorEntity, SensorEntity):
+    """Representation of a Meridian Solar sensor."""
 
-    def __init__(self, coordinator, name, unique_id):
+    entity_description: MeridianSolarSensorEntityDescription
+    _attr_has_entity_name = True
+    # State only ever arrives through the coordinator
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, description: MeridianSolarSensorEntityDescription):
+        """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_name = name
-        self._attr_unique_id = unique_id
-        self._attr_has_entity_name = True
-        
-        self._attr_device_info = DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, coordinator.username)},
-            manufacturer="Meridian Energy",
-            name="Meridian Solar",
-            model="Solar Plan",
-            configuration_url="https://secure.meridianenergy.co.nz/",
-        )
+        self.entity_description = description
+        self._attr_unique_id = f"meridian_solar_{description.key}"
+
+        # The device info never changes, so the sensors share one instance
+        device_info = _DEVICE_INFO_CACHE.get(coordinator.username)
+        if device_info is None:
+            device_info = _DEVICE_INFO_CACHE[coordinator.username] = DeviceInfo(
+                entry_type=DeviceEntryType.SERVICE,
+                identifiers={(DOMAIN, coordinator.username)},
+                manufacturer="Meridian Energy",
+                name="Meridian Solar",
+                model="Solar Plan",
+                configuration_url="https://secure.meridianenergy.co.nz/",
+            )
+        self._attr_device_info = device_info
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
 
     @property
     def available(self) -> bool:
@@ -60,8 +134,13 @@ class MeridianSolarBaseSensor(CoordinatorEntity, SensorEntity):
         # Individual sensors will return default values if no data
         return True
 
-    @property
-    def extra_state_attributes(self):
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached attributes before writing the new state."""
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(self):
         """Return additional state attributes."""
         # Safely get coordinator attributes with fallbacks
         last_update = None
@@ -80,95 +159,10 @@ class MeridianSolarBaseSensor(CoordinatorEntity, SensorEntity):
             "integration_version": "2.2.5",
         }
 
-class MeridianSolarRateSensor(MeridianSolarBaseSensor):
-    """Representation of a Meridian Solar rate sensor."""
-
-    def __init__(self, coordinator, rate_type):
-        """Initialize the sensor."""
-        super().__init__(coordinator, f"Meridian Solar {rate_type.title()} Rate", f"meridian_solar_{rate_type}_rate")
-        self.rate_type = rate_type
-        self._attr_native_unit_of_measurement = "$/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = None  # Monetary sensors should not use measurement state class
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            # Return default rate instead of None to prevent "Unavailable"
-            return 0.25
-        if self.rate_type == "current":
-            return self.coordinator.data.get(ATTR_CURRENT_RATE, 0.25)
-        return self.coordinator.data.get(ATTR_NEXT_RATE, 0.25)
-
-class MeridianSolarGenerationSensor(MeridianSolarBaseSensor):
-    """Representation of a Meridian Solar generation sensor."""
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, "Meridian Solar Generation", "meridian_solar_generation")
-        self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-        self._attr_device_class = SensorDeviceClass.POWER
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            # Return 0.0 instead of None to prevent "Unavailable"
-            return 0.0
-        return self.coordinator.data.get(ATTR_SOLAR_GENERATION, 0.0)
-
-class MeridianSolarDailyConsumptionSensor(MeridianSolarBaseSensor):
-    """Representation of a Meridian Solar daily consumption sensor."""
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, "Meridian Solar Daily Consumption", "meridian_solar_daily_consumption")
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            # Return 0.0 instead of None to prevent "Unavailable"
-            return 0.0
-        return self.coordinator.data.get(ATTR_DAILY_CONSUMPTION, 0.0)
-
-class MeridianSolarDailyFeedInSensor(MeridianSolarBaseSensor):
-    """Representation of a Meridian Solar daily feed-in sensor."""
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, "Meridian Solar Daily Feed In", "meridian_solar_daily_feed_in")
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            # Return 0.0 instead of None to prevent "Unavailable"
-            return 0.0
-        return self.coordinator.data.get(ATTR_DAILY_FEED_IN, 0.0)
-
-class MeridianSolarAverageDailyUseSensor(MeridianSolarBaseSensor):
-    """Representation of a Meridian Solar average daily usage sensor."""
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, "Meridian Solar Average Daily Use", "meridian_solar_average_daily_use")
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = None  # Average values don't need state class
-
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            # Return 0.0 instead of None to prevent "Unavailable"
-            return 0.0
-        return self.coordinator.data.get(ATTR_AVERAGE_DAILY_USE, 0.0) 
\ No newline at end of file
+        data = self.coordinator.data
+        if not data:
+            return self.entity_description.default
+        return data.get(self.entity_description.data_key, self.entity_description.default)
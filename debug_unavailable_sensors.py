@@ -6,16 +6,60 @@ This simulates exactly what the HA coordinator does
 
 import asyncio
 import aiohttp
+import csv
+import io
 import json
 import re
+from itertools import islice
 from datetime import datetime, timedelta
 import logging
 
+# Both patterns are ASCII, so they match the raw page bytes without decoding
+_CSRF_RE = re.compile(rb'name="authenticity_token"\s+value="([^"]+)"')
+_KWH_RE = re.compile(rb'(\d+\.?\d*)\s*kWh', re.IGNORECASE)
+
 # Set up detailed logging
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
 )
+_LOGGER = logging.getLogger(__name__)
+
+# One session per process so repeat runs keep the connector's DNS, TLS and
+# keep-alive state; headers shared by every request are session defaults
+_SESSION_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Referer": "https://secure.meridianenergy.co.nz/login",
+}
+_session: aiohttp.ClientSession | None = None
+_session_lock = asyncio.Lock()
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use"""
+    global _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            # Same settings as coordinator
+            _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, limit_per_host=2),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                headers=_SESSION_HEADERS,
+            )
+        return _session
+
+async def close_session():
+    """Close the shared session if it was opened"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+async def fetch_csv(session, csv_url):
+    """GET a candidate CSV URL, returning its status, content type and body"""
+    async with session.get(csv_url) as response:
+        if response.status != 200:
+            return response.status, "", ""
+        return response.status, response.headers.get('content-type', ''), await response.text()
 
 async def debug_coordinator_issues():
     """Debug the exact coordinator process that HA uses"""
@@ -33,16 +77,7 @@ async def debug_coordinator_issues():
     username = config["username"]
     password = config["password"]
     
-    # Create session with same settings as coordinator
-    connector = aiohttp.TCPConnector(limit=10, limit_per_host=2)
-    timeout = aiohttp.ClientTimeout(total=30, connect=10)
-    session = aiohttp.ClientSession(
-        connector=connector,
-        timeout=timeout,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-    )
+    session = await get_session()
     
     try:
         print(f"\n🔐 Step 1: Authentication Test")
@@ -56,16 +91,16 @@ async def debug_coordinator_issues():
                 print(f"   ❌ Login page failed: {response.status}")
                 return
             
-            html = await response.text()
-            print(f"   ✅ Login page loaded ({len(html)} chars)")
+            html = await response.read()
+            print(f"   ✅ Login page loaded ({len(html)} bytes)")
             
             # Extract CSRF token
-            token_match = re.search(r'name="authenticity_token"\s+value="([^"]+)"', html)
+            token_match = _CSRF_RE.search(html)
             if not token_match:
                 print("   ❌ CSRF token not found")
                 return
                 
-            csrf_token = token_match.group(1)
+            csrf_token = token_match.group(1).decode()
             print(f"   ✅ CSRF token: {csrf_token[:20]}...")
         
         # Step 2: Login
@@ -77,14 +112,9 @@ async def debug_coordinator_issues():
             "commit": "Sign in"
         }
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Referer": "https://secure.meridianenergy.co.nz/login",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
+        # Form data is sent url-encoded; User-Agent and Referer come from the session
         async with session.post("https://secure.meridianenergy.co.nz/", 
-                               data=login_data, headers=headers, allow_redirects=False) as response:
+                               data=login_data, allow_redirects=False) as response:
             
             print(f"   Login response: {response.status}")
             if response.status not in [200, 302, 303]:
@@ -97,7 +127,7 @@ async def debug_coordinator_issues():
         
         # Step 3: Test dashboard access
         print(f"\n📊 Step 2: Dashboard Access Test")
-        async with session.get("https://secure.meridianenergy.co.nz/", headers=headers) as response:
+        async with session.get("https://secure.meridianenergy.co.nz/") as response:
             if response.status != 200:
                 print(f"   ❌ Dashboard access failed: {response.status}")
                 return
@@ -121,15 +151,16 @@ async def debug_coordinator_issues():
         ]
         
         csv_success = False
-        for csv_url in csv_urls:
-            print(f"   Trying: {csv_url}")
-            async with session.get(csv_url, headers=headers) as response:
-                print(f"   Status: {response.status}")
+        # Request every candidate at once but report them in order, so a
+        # late working URL doesn't wait behind the failing ones
+        tasks = [asyncio.create_task(fetch_csv(session, csv_url)) for csv_url in csv_urls]
+        try:
+            for csv_url, task in zip(csv_urls, tasks):
+                print(f"   Trying: {csv_url}")
+                status, content_type, csv_data = await task
+                print(f"   Status: {status}")
                 
-                if response.status == 200:
-                    content_type = response.headers.get('content-type', '')
-                    csv_data = await response.text()
-                    
+                if status == 200:
                     print(f"   Content-Type: {content_type}")
                     print(f"   Data size: {len(csv_data)} bytes")
                     
@@ -137,33 +168,38 @@ async def debug_coordinator_issues():
                         print("   ✅ Valid CSV data found!")
                         csv_success = True
                         
-                        # Parse for today's data
-                        lines = csv_data.strip().split('\n')
-                        print(f"   CSV has {len(lines)} lines")
+                        # Parse for today's data, reading only the rows we check
+                        line_count = csv_data.count("\n")
+                        print(f"   CSV has {line_count} lines")
+                        reader = csv.reader(io.StringIO(csv_data))
+                        next(reader, None)  # Skip header
+                        rows = list(islice(reader, 4))  # Check first few data lines
                         
-                        today = datetime.now().strftime("%-d/%-m/%Y")
+                        now = datetime.now()
+                        today = f"{now.day}/{now.month}/{now.year}"
                         print(f"   Looking for today's data: {today}")
                         
                         found_today = False
-                        for line in lines[1:5]:  # Check first few data lines
-                            if today in line:
+                        for row in rows:
+                            if len(row) > 3 and row[3] == today:  # Date column
                                 found_today = True
-                                print(f"   ✅ Found today's data: {line[:80]}...")
+                                print(f"   ✅ Found today's data: {','.join(row)[:80]}...")
                                 break
                         
                         if not found_today:
                             print(f"   ⚠️ No data for today ({today})")
                             print("   Sample dates in CSV:")
-                            for line in lines[1:4]:
-                                if line.strip():
-                                    parts = line.split(',')
-                                    if len(parts) > 3:
-                                        print(f"      {parts[3]}")
+                            for row in rows[:3]:
+                                if len(row) > 3:
+                                    print(f"      {row[3]}")
                         break
                     else:
                         print(f"   ❌ Invalid CSV data")
                 else:
-                    print(f"   ❌ Failed: {response.status}")
+                    print(f"   ❌ Failed: {status}")
+        finally:
+            for task in tasks:
+                task.cancel()
         
         if not csv_success:
             print("   ❌ No CSV data available - this is likely the main issue!")
@@ -177,15 +213,15 @@ async def debug_coordinator_issues():
         
         for url, page_type in pages:
             print(f"   Testing {page_type} page...")
-            async with session.get(url, headers=headers) as response:
+            async with session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    print(f"   ✅ {page_type} page accessible ({len(html)} chars)")
+                    html = await response.read()
+                    print(f"   ✅ {page_type} page accessible ({len(html)} bytes)")
                     
                     # Look for energy data
-                    kwh_matches = re.findall(r'(\d+\.?\d*)\s*kWh', html, re.IGNORECASE)
+                    kwh_matches = _KWH_RE.findall(html)
                     if kwh_matches:
-                        print(f"   ✅ Found kWh values: {kwh_matches[:3]}")
+                        print(f"   ✅ Found kWh values: {[match.decode() for match in kwh_matches[:3]]}")
                     else:
                         print(f"   ⚠️ No kWh values found")
                 else:
@@ -218,13 +254,15 @@ async def debug_coordinator_issues():
         print("3. Try manually triggering sensor update in HA")
         print("4. Verify credentials are correct in HA integration config")
         
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-    
+    except Exception:
+        _LOGGER.exception("❌ Unexpected error")
+
+async def main():
+    """Run the diagnosis and close the shared session"""
+    try:
+        await debug_coordinator_issues()
     finally:
-        await session.close()
+        await close_session()
 
 if __name__ == "__main__":
-    asyncio.run(debug_coordinator_issues())
+    asyncio.run(main())
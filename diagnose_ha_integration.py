@@ -6,10 +6,14 @@ This script simulates the exact HA coordinator behavior and identifies problems
 
 import asyncio
 import aiohttp
+import codecs
 import json
 import re
 from datetime import datetime, timedelta
+from itertools import islice
 import logging
+import os
+import sys
 
 # Set up detailed logging like HA
 logging.basicConfig(
@@ -17,6 +21,100 @@ logging.basicConfig(
     format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
 )
 
+_CSRF_RE = re.compile(r'name="authenticity_token"\s+value="([^"]+)"')
+
+# One session per process, shared by every coordinator, so the connection
+# pool, DNS cache and TLS sessions outlive a single update
+_shared_session: aiohttp.ClientSession | None = None
+_session_lock = asyncio.Lock()
+# Candidate CSV download URLs, in order of preference
+CSV_URLS = (
+    "https://secure.meridianenergy.co.nz/feed_in_report.csv",
+    "https://secure.meridianenergy.co.nz/feed_in_report/download",
+    "https://secure.meridianenergy.co.nz/feed_in_report/export",
+    "https://secure.meridianenergy.co.nz/customers/feed_in_report.csv",
+)
+# With --reuse-cookies, portal cookies are kept between runs so a
+# still-valid login is reused instead of signing in again
+COOKIE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test", "cookies.pickle")
+REUSE_COOKIES = "--reuse-cookies" in sys.argv
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use"""
+    global _shared_session
+    async with _session_lock:
+        if _shared_session is None or _shared_session.closed:
+            # Enough per-host slots for the concurrent CSV probes
+            connector = aiohttp.TCPConnector(limit=10, limit_per_host=4, keepalive_timeout=75)
+            timeout = aiohttp.ClientTimeout(total=30, connect=10)
+            cookie_jar = aiohttp.CookieJar()
+            if REUSE_COOKIES and os.path.exists(COOKIE_FILE):
+                cookie_jar.load(COOKIE_FILE)
+            _shared_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                cookie_jar=cookie_jar,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                }
+            )
+        return _shared_session
+
+async def read_head(response, size=4096):
+    """Return up to size bytes from the start of the body, stopping at EOF
+
+    A single read() returns whatever has arrived, which may be a few bytes.
+    """
+    head = b""
+    while len(head) < size and (chunk := await response.content.read(size - len(head))):
+        head += chunk
+    return head
+
+async def read_csv_lines(response, head=b""):
+    """Return the non-blank lines of a CSV body, decoded in 64 KB chunks
+
+    head is any start of the body already read off the stream.
+    """
+    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+    lines = []
+    pending = decoder.decode(head)
+    async for chunk in response.content.iter_chunked(65536):
+        *complete, pending = (pending + decoder.decode(chunk)).split("\n")
+        lines.extend(line.rstrip("\r") for line in complete if line.strip())
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        lines.append(pending.rstrip("\r"))
+    return lines
+
+def safe_float(field):
+    """Convert a CSV reading, treating blank or non-numeric fields as 0"""
+    try:
+        return float(field)
+    except ValueError:
+        return 0.0
+
+def half_hour_readings(parts):
+    """Return the 48 half-hour readings (columns 4-51) of a CSV row"""
+    fields = parts[4:52]
+    try:
+        # Converts the whole row in C; most rows are all numeric
+        return list(map(float, fields))
+    except ValueError:
+        return [safe_float(field) for field in fields]
+
+async def close_session():
+    """Close the shared HTTP session if it was opened"""
+    global _shared_session
+    if _shared_session is not None:
+        try:
+            if REUSE_COOKIES:
+                _shared_session.cookie_jar.save(COOKIE_FILE)
+        except OSError as e:
+            print(f"⚠️ Could not save cookies to {COOKIE_FILE}: {e}")
+        finally:
+            await _shared_session.close()
+            _shared_session = None
+
 class MockMeridianCoordinator:
     """Simulate the actual HA coordinator"""
     
@@ -35,22 +133,27 @@ class MockMeridianCoordinator:
         self._logger.setLevel(logging.DEBUG)
     
     async def _create_session(self):
-        """Create HTTP session like HA coordinator"""
-        if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(limit=10, limit_per_host=2)
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-            )
+        """Attach the shared HTTP session, like HA's pooled client session"""
+        self._session = await get_session()
+    
+    async def _session_still_valid(self) -> bool:
+        """Return True if saved cookies still open the CSV export"""
+        try:
+            # GET like the CSV probe; the endpoint isn't known to answer HEAD.
+            # A lapsed session redirects to the login page instead
+            async with self._session.get(CSV_URLS[0], allow_redirects=False) as response:
+                if response.status != 200:
+                    return False
+                head = await read_head(response)
+                return b',' in head and not head.lstrip().startswith(b'<')
+        except Exception as e:
+            self._logger.debug("Session check failed: %s", e)
+            return False
     
     async def _authenticate(self) -> bool:
         """Authenticate exactly like HA coordinator"""
         self._logger.info("🔐 Starting authentication process...")
-        self._logger.debug(f"Username: {self.username}")
+        self._logger.debug("Username: %s", self.username)
         
         await self._create_session()
         
@@ -63,16 +166,21 @@ class MockMeridianCoordinator:
                     return False
                 
                 html = await response.text()
-                self._logger.debug(f"✅ Login page loaded ({len(html)} chars)")
+                self._logger.debug("✅ Login page loaded (%d chars)", len(html))
                 
-                # Extract CSRF token
-                token_match = re.search(r'name="authenticity_token"\s+value="([^"]+)"', html)
+                # Extract CSRF token, starting the regex just before the
+                # first mention so it skips everything that precedes it
+                token_index = html.find('authenticity_token')
+                if token_index < 0:
+                    self._logger.error("❌ CSRF token not found")
+                    return False
+                token_match = _CSRF_RE.search(html, max(0, token_index - len('name="')))
                 if not token_match:
                     self._logger.error("❌ CSRF token not found")
                     return False
                     
                 csrf_token = token_match.group(1)
-                self._logger.debug(f"✅ CSRF token: {csrf_token[:20]}...")
+                self._logger.debug("✅ CSRF token: %s...", csrf_token[:20])
             
             # Perform login
             self._logger.debug("🔑 Performing login...")
@@ -91,7 +199,7 @@ class MockMeridianCoordinator:
             async with self._session.post(self.dashboard_url, 
                                          data=login_data, headers=headers, allow_redirects=False) as response:
                 
-                self._logger.debug(f"Login response: {response.status}")
+                self._logger.debug("Login response: %s", response.status)
                 if response.status not in [200, 302, 303]:
                     self._logger.error(f"❌ Login failed with status {response.status}")
                     return False
@@ -104,12 +212,43 @@ class MockMeridianCoordinator:
             self._logger.error(f"❌ Authentication error: {e}")
             return False
     
+    async def _try_csv(self, csv_url, headers):
+        """Return the CSV lines served at csv_url, or None if it isn't CSV"""
+        try:
+            self._logger.debug("Trying %s", csv_url)
+            async with self._session.get(csv_url, headers=headers) as response:
+                self._logger.debug("Status: %s", response.status)
+                
+                if response.status == 200:
+                    content_type = response.headers.get('content-type', '')
+                    
+                    # The header row decides it, whatever the content type:
+                    # CSV starts with comma-separated names, not HTML markup
+                    head = await read_head(response)
+                    if b',' not in head or head.lstrip().startswith(b'<'):
+                        self._logger.debug("Content doesn't look like CSV (Content-Type: %s)", content_type)
+                        return None  # The rest of the body is never read
+                    
+                    # Streamed straight into lines; the body is never one string
+                    lines = await read_csv_lines(response, head)
+                    self._logger.debug("Content-Type: %s, Lines: %d", content_type, len(lines))
+                    self._logger.info(f"✅ Valid CSV found at: {csv_url}")
+                    return lines
+        except Exception as e:
+            self._logger.debug("Error with %s: %s", csv_url, e)
+        return None
+    
     async def _test_csv_download(self) -> dict:
         """Test CSV download exactly like HA coordinator"""
         self._logger.info("📥 Testing CSV download...")
         
         if not self._logged_in:
-            if not await self._authenticate():
+            # Cookies saved by an earlier --reuse-cookies run may still be good
+            await self._create_session()
+            if REUSE_COOKIES and await self._session_still_valid():
+                self._logger.info("✅ Reusing saved portal session")
+                self._logged_in = True
+            elif not await self._authenticate():
                 return {}
         
         headers = {
@@ -117,54 +256,29 @@ class MockMeridianCoordinator:
             "Referer": "https://secure.meridianenergy.co.nz/feed_in_report"
         }
         
-        csv_urls = [
-            "https://secure.meridianenergy.co.nz/feed_in_report.csv",
-            "https://secure.meridianenergy.co.nz/feed_in_report/download",
-            "https://secure.meridianenergy.co.nz/feed_in_report/export",
-            "https://secure.meridianenergy.co.nz/customers/feed_in_report.csv"
-        ]
-        
-        for csv_url in csv_urls:
-            try:
-                self._logger.debug(f"Trying {csv_url}")
-                async with self._session.get(csv_url, headers=headers) as response:
-                    self._logger.debug(f"Status: {response.status}")
-                    
-                    if response.status == 200:
-                        content_type = response.headers.get('content-type', '')
-                        csv_data = await response.text()
-                        
-                        self._logger.debug(f"Content-Type: {content_type}, Size: {len(csv_data)}")
-                        
-                        # Enhanced CSV detection
-                        if ('csv' in content_type.lower() or 'text' in content_type.lower() or 
-                            'application/octet-stream' in content_type.lower() or
-                            ',' in csv_data or 'Date,Time' in csv_data or 'Feed-in' in csv_data or
-                            'Consumption' in csv_data or len(csv_data) > 100):
-                            
-                            lines = csv_data.split('\n')
-                            if any(',' in line for line in lines if line.strip()):
-                                self._logger.info(f"✅ Valid CSV found at: {csv_url}")
-                                return {"csv_data": csv_data}
-                            else:
-                                self._logger.debug(f"Content doesn't look like CSV")
-            except Exception as e:
-                self._logger.debug(f"Error with {csv_url}: {e}")
+        # Try every URL concurrently, preferring earlier ones like the coordinator
+        tasks = [asyncio.create_task(self._try_csv(csv_url, headers)) for csv_url in CSV_URLS]
+        try:
+            for task in tasks:
+                if (csv_lines := await task) is not None:
+                    return {"csv_lines": csv_lines}
+        finally:
+            for task in tasks:
+                task.cancel()
         
         self._logger.warning("❌ No CSV download found")
         return {}
     
-    async def _extract_data_from_csv(self) -> dict:
-        """Extract data from CSV exactly like HA coordinator"""
+    async def _extract_data_from_csv(self, today) -> dict:
+        """Extract today's data from CSV exactly like HA coordinator"""
         self._logger.info("📥 Starting CSV data extraction...")
         
         csv_result = await self._test_csv_download()
-        if not csv_result.get("csv_data"):
+        if not csv_result.get("csv_lines"):
             self._logger.warning("Could not download CSV data")
             raise Exception("Could not download CSV data")
         
-        csv_data = csv_result["csv_data"]
-        lines = csv_data.strip().split('\n')
+        lines = csv_result["csv_lines"]
         
         if len(lines) < 2:
             raise Exception("CSV data is empty or invalid")
@@ -180,73 +294,60 @@ class MockMeridianCoordinator:
         }
         
         # Parse CSV lines (skip header)
-        today = datetime.now().strftime("%-d/%-m/%Y")
-        self._logger.debug(f"Looking for today's date in CSV: {today}")
+        self._logger.debug("Looking for today's date in CSV: %s", today)
         
         found_today_data = False
-        for line in lines[1:]:
-            if not line.strip():
+        for line in islice(lines, 1, None):
+            # Split off just the leading columns; only today's rows need all 52
+            head = line.split(',', 4)
+            if len(head) < 5 or head[3] != today:
                 continue
-                
             parts = line.split(',')
-            if len(parts) < 52:
+            if len(parts) < 52:  # Like the coordinator, skip partial rows
                 continue
             
-            try:
-                meter_element = parts[2]
-                date = parts[3]
-                
-                if date == today:
-                    found_today_data = True
-                    self._logger.debug(f"✅ Found today's data for {meter_element}")
-                    
-                    # Sum half-hour values
-                    half_hour_values = []
-                    for i in range(4, min(52, len(parts))):
-                        try:
-                            value = float(parts[i])
-                            half_hour_values.append(value)
-                        except ValueError:
-                            half_hour_values.append(0.0)
-                    
-                    daily_total = sum(half_hour_values)
-                    
-                    if meter_element == "Feed-in":
-                        data["daily_feed_in"] = daily_total
-                        for value in reversed(half_hour_values):
-                            if value > 0:
-                                data["solar_generation"] = value
-                                break
-                    elif meter_element == "Consumption":
-                        data["daily_consumption"] = daily_total
-            except (ValueError, IndexError):
-                continue
+            # Only today's rows get here, and half_hour_readings never raises
+            meter_element = parts[2]
+            found_today_data = True
+            self._logger.debug("✅ Found today's data for %s", meter_element)
+            
+            # Sum half-hour values
+            half_hour_values = half_hour_readings(parts)
+            
+            daily_total = sum(half_hour_values)
+            
+            if meter_element == "Feed-in":
+                data["daily_feed_in"] = daily_total
+                for value in reversed(half_hour_values):
+                    if value > 0:
+                        data["solar_generation"] = value
+                        break
+            elif meter_element == "Consumption":
+                data["daily_consumption"] = daily_total
         
         if not found_today_data:
             self._logger.warning(f"⚠️ No data found for today ({today})")
-            # Try to use most recent data
-            recent_dates = []
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-                parts = line.split(',')
-                if len(parts) > 3:
-                    recent_dates.append(parts[3])
+            # Try to use most recent data: the last dated row, found from the end
+            recent_date = None
+            for line in islice(reversed(lines), len(lines) - 1):  # Stop before header
+                head = line.split(',', 4)
+                if len(head) > 3:
+                    recent_date = head[3]
+                    break
             
-            if recent_dates:
-                recent_date = recent_dates[-1]
-                self._logger.debug(f"Using most recent date: {recent_date}")
+            if recent_date:
+                self._logger.debug("Using most recent date: %s", recent_date)
                 # [Add recent data parsing logic here if needed]
         
-        self._logger.debug(f"Final CSV data: {data}")
+        self._logger.debug("Final CSV data: %s", data)
         return data
     
-    async def _extract_data_from_portal(self) -> dict:
+    async def _extract_data_from_portal(self, today) -> dict:
         """Extract data from portal exactly like HA coordinator"""
         self._logger.debug("🌐 Starting portal data extraction...")
         
         try:
-            return await self._extract_data_from_csv()
+            return await self._extract_data_from_csv(today)
         except Exception as csv_err:
             self._logger.warning(f"CSV extraction failed: {csv_err}")
             
@@ -264,13 +365,17 @@ class MockMeridianCoordinator:
     async def _async_update_data(self):
         """Main update method exactly like HA coordinator"""
         self._logger.info("🔄 Starting data update cycle...")
-        self._logger.debug(f"Session state: logged_in={self._logged_in}, retry_count={self._retry_count}")
+        self._logger.debug("Session state: logged_in=%s, retry_count=%s", self._logged_in, self._retry_count)
         
         try:
             self._retry_count = 0
             
+            # Format today's date once per cycle, as the CSV writes it (1/9/2025)
+            now = datetime.now()
+            today = f"{now.day}/{now.month}/{now.year}"
+            
             self._logger.debug("🌐 Calling _extract_data_from_portal()...")
-            data = await self._extract_data_from_portal()
+            data = await self._extract_data_from_portal(today)
             
             if data is None:
                 self._logger.error("❌ _extract_data_from_portal() returned None")
@@ -295,9 +400,8 @@ class MockMeridianCoordinator:
             raise
     
     async def close(self):
-        """Clean up session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release the session; the shared one is closed by close_session()"""
+        self._session = None
 
 async def diagnose_integration():
     """Run full diagnosis"""
@@ -342,5 +446,12 @@ async def diagnose_integration():
     finally:
         await coordinator.close()
 
+async def main():
+    """Run the diagnosis and close the shared session"""
+    try:
+        await diagnose_integration()
+    finally:
+        await close_session()
+
 if __name__ == "__main__":
-    asyncio.run(diagnose_integration())
+    asyncio.run(main())
@@ -10,6 +10,19 @@ import json
 import re
 from test_meridian_api import MeridianPortalTester
 
+# Energy-related keywords that mark a page as promising (lowercase)
+_PAGE_KEYWORDS = ('kwh', 'solar', 'generation', 'consumption', 'usage', 'feed', 'export', 'chart', 'data')
+
+# Data patterns looked for on promising pages, fused so each page is
+# scanned once; the named group that matched says which kind it is
+_PAGE_DATA_RE = re.compile(
+    r'href=["\'](?P<download>[^"\']*(?:download|export|csv)[^"\']*)["\']'
+    r'|(?P<kwh>\d+\.?\d*)\s*kWh'
+    r'|\$(?P<dollar>\d+\.?\d*)'
+    r'|(?P<chart_key>chart|data|api)["\'\s]*[:=]["\'\s]*(?P<chart>[^"\';\s]+)',
+    re.IGNORECASE,
+)
+
 async def debug_portal_structure():
     """Debug the portal structure to find data sources"""
     
@@ -58,33 +71,45 @@ async def debug_portal_structure():
             "Referer": "https://secure.meridianenergy.co.nz/"
         }
         
-        found_pages = []
+        # Fetch pages concurrently, a few at a time
+        semaphore = asyncio.Semaphore(5)
         
-        for page in pages_to_check:
-            try:
-                url = f"https://secure.meridianenergy.co.nz{page}"
+        async def fetch(url):
+            """Return the page's status and its HTML (None unless 200)"""
+            async with semaphore:
                 async with tester._session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        
-                        # Look for energy-related keywords
-                        keywords = ['kwh', 'solar', 'generation', 'consumption', 'usage', 'feed', 'export', 'chart', 'data']
-                        found_keywords = [k for k in keywords if k.lower() in html.lower()]
-                        
-                        if found_keywords:
-                            found_pages.append({
-                                'url': url,
-                                'keywords': found_keywords,
-                                'length': len(html)
-                            })
-                            print(f"   ✅ {url} - Keywords: {', '.join(found_keywords)}")
-                        else:
-                            print(f"   ⚪ {url} - No energy keywords")
-                    else:
-                        print(f"   ❌ {url} - Status: {response.status}")
-                        
-            except Exception as e:
-                print(f"   ⚠️  {url} - Error: {e}")
+                    if response.status != 200:
+                        return response.status, None
+                    return response.status, await response.text()
+        
+        found_pages = []
+        
+        urls = [f"https://secure.meridianenergy.co.nz{page}" for page in pages_to_check]
+        results = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+        
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                print(f"   ⚠️  {url} - Error: {result}")
+                continue
+            
+            status, html = result
+            if html is None:
+                print(f"   ❌ {url} - Status: {status}")
+                continue
+            
+            # Look for energy-related keywords in one lowercased copy of the page
+            html_lower = html.lower()
+            found_keywords = [k for k in _PAGE_KEYWORDS if k in html_lower]
+            
+            if found_keywords:
+                found_pages.append({
+                    'url': url,
+                    'keywords': found_keywords,
+                    'length': len(html)
+                })
+                print(f"   ✅ {url} - Keywords: {', '.join(found_keywords)}")
+            else:
+                print(f"   ⚪ {url} - No energy keywords")
         
         print(f"\n📊 Summary: Found {len(found_pages)} relevant pages")
         
@@ -92,40 +117,46 @@ async def debug_portal_structure():
         if found_pages:
             print("\n🔍 Analyzing promising pages for data patterns...")
             
-            for page in found_pages[:3]:  # Check top 3 most promising
-                try:
-                    async with tester._session.get(page['url'], headers=headers) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            
-                            print(f"\n📄 {page['url']}:")
-                            
-                            # Look for numbers with kWh
-                            kwh_pattern = r'(\d+\.?\d*)\s*kWh'
-                            kwh_matches = re.findall(kwh_pattern, html, re.IGNORECASE)
-                            if kwh_matches:
-                                print(f"   💡 kWh values found: {kwh_matches[:5]}")
-                            
-                            # Look for dollar amounts
-                            dollar_pattern = r'\$(\d+\.?\d*)'
-                            dollar_matches = re.findall(dollar_pattern, html, re.IGNORECASE)
-                            if dollar_matches:
-                                print(f"   💰 Dollar amounts: {dollar_matches[:5]}")
-                            
-                            # Look for charts/data endpoints
-                            chart_pattern = r'(chart|data|api)["\'\s]*[:=]["\'\s]*([^"\';\s]+)'
-                            chart_matches = re.findall(chart_pattern, html, re.IGNORECASE)
-                            if chart_matches:
-                                print(f"   📈 Chart/data endpoints: {chart_matches[:3]}")
-                            
-                            # Look for download links
-                            download_pattern = r'href=["\']([^"\']*(?:download|export|csv)[^"\']*)["\']'
-                            download_matches = re.findall(download_pattern, html, re.IGNORECASE)
-                            if download_matches:
-                                print(f"   📥 Download links: {download_matches[:3]}")
-                                
-                except Exception as e:
-                    print(f"   ⚠️  Error analyzing {page['url']}: {e}")
+            promising = found_pages[:3]  # Check top 3 most promising
+            results = await asyncio.gather(
+                *(fetch(page['url']) for page in promising), return_exceptions=True
+            )
+            for page, result in zip(promising, results):
+                if isinstance(result, Exception):
+                    print(f"   ⚠️  Error analyzing {page['url']}: {result}")
+                    continue
+                
+                _, html = result
+                if html is not None:
+                    print(f"\n📄 {page['url']}:")
+                    
+                    found = {"kwh": [], "dollar": [], "chart": [], "download": []}
+                    for match in _PAGE_DATA_RE.finditer(html):
+                        kind = match.lastgroup
+                        if kind == "chart":
+                            found[kind].append((match["chart_key"], match["chart"]))
+                        else:
+                            found[kind].append(match[kind])
+                    
+                    # Look for numbers with kWh
+                    kwh_matches = found["kwh"]
+                    if kwh_matches:
+                        print(f"   💡 kWh values found: {kwh_matches[:5]}")
+                    
+                    # Look for dollar amounts
+                    dollar_matches = found["dollar"]
+                    if dollar_matches:
+                        print(f"   💰 Dollar amounts: {dollar_matches[:5]}")
+                    
+                    # Look for charts/data endpoints
+                    chart_matches = found["chart"]
+                    if chart_matches:
+                        print(f"   📈 Chart/data endpoints: {chart_matches[:3]}")
+                    
+                    # Look for download links
+                    download_matches = found["download"]
+                    if download_matches:
+                        print(f"   📥 Download links: {download_matches[:3]}")
         
         print("\n" + "=" * 50)
         print("🎯 Next Steps:")
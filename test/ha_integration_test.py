@@ -25,13 +25,7 @@ logging.basicConfig(
 # Import the actual integration components
 try:
     from __init__ import MeridianSolarDataUpdateCoordinator
-    from sensor import (
-        MeridianSolarRateSensor,
-        MeridianSolarGenerationSensor, 
-        MeridianSolarDailyConsumptionSensor,
-        MeridianSolarDailyFeedInSensor,
-        MeridianSolarAverageDailyUseSensor
-    )
+    from sensor import MeridianSolarSensor, SENSORS
     print("✅ Successfully imported integration components")
 except ImportError as e:
     print(f"❌ Failed to import integration: {e}")
@@ -97,14 +91,7 @@ async def test_coordinator_and_sensors():
     
     # Create all sensors (like HA does)
     print("\n🔧 Creating Sensors...")
-    sensors = [
-        MeridianSolarRateSensor(coordinator, "current"),
-        MeridianSolarRateSensor(coordinator, "next"), 
-        MeridianSolarGenerationSensor(coordinator),
-        MeridianSolarDailyConsumptionSensor(coordinator),
-        MeridianSolarDailyFeedInSensor(coordinator),
-        MeridianSolarAverageDailyUseSensor(coordinator),
-    ]
+    sensors = [MeridianSolarSensor(coordinator, description) for description in SENSORS]
     
     print(f"✅ Created {len(sensors)} sensors")
     
@@ -114,9 +101,9 @@ async def test_coordinator_and_sensors():
         try:
             name = sensor.name
             value = sensor.native_value
-            unit = getattr(sensor, '_attr_native_unit_of_measurement', 'N/A')
-            device_class = getattr(sensor, '_attr_device_class', 'N/A')
-            state_class = getattr(sensor, '_attr_state_class', 'N/A')
+            unit = sensor.native_unit_of_measurement
+            device_class = sensor.device_class
+            state_class = sensor.state_class
             
             print(f"   🔹 {name}")
             print(f"      Value: {value} {unit}")
@@ -137,7 +124,7 @@ async def test_coordinator_and_sensors():
         print("\n📊 Updated Sensor Values:")
         for sensor in sensors:
             value = sensor.native_value
-            unit = getattr(sensor, '_attr_native_unit_of_measurement', '')
+            unit = sensor.native_unit_of_measurement or ''
             print(f"   🔸 {sensor.name}: {value} {unit}")
             
     except Exception as e:
@@ -8,6 +8,20 @@ import aiohttp
 import json
 import re
 
+_TOKEN_RE = re.compile(r'name="authenticity_token"\s+value="([^"]+)"')
+_NAV_RE = re.compile(r'href="([^"]*(?:usage|solar|feed|report|bill|account)[^"]*)"', re.IGNORECASE)
+_KWH_RE = re.compile(r'(\d+\.?\d*)\s*kWh', re.IGNORECASE)
+_DOLLAR_RE = re.compile(r'\$(\d+\.?\d*)')
+_DOWNLOAD_RE = re.compile(r'href="([^"]*(?:download|export|csv)[^"]*)"', re.IGNORECASE)
+
+async def fetch(session, sem, url, headers):
+    """GET a URL, returning its status and text (None unless 200)"""
+    async with sem:
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.text()
+
 async def check_portal_pages():
     """Check what pages are available in your portal"""
     
@@ -22,7 +36,11 @@ async def check_portal_pages():
     print("🔍 Checking Meridian Portal Pages")
     print("=" * 40)
     
-    async with aiohttp.ClientSession() as session:
+    # The page probes below run concurrently over one pooled, keep-alive connection set
+    connector = aiohttp.TCPConnector(limit=16, limit_per_host=8, keepalive_timeout=30)
+    # Keep in-flight probes at the per-host connection limit
+    sem = asyncio.Semaphore(8)
+    async with aiohttp.ClientSession(connector=connector) as session:
         # Step 1: Get login page and token
         print("🌐 Getting login page...")
         async with session.get("https://secure.meridianenergy.co.nz/login") as response:
@@ -33,7 +51,7 @@ async def check_portal_pages():
             html = await response.text()
             
             # Extract CSRF token
-            token_match = re.search(r'name="authenticity_token"\s+value="([^"]+)"', html)
+            token_match = _TOKEN_RE.search(html)
             if not token_match:
                 print("❌ Can't find CSRF token")
                 return
@@ -73,7 +91,7 @@ async def check_portal_pages():
                 print("✅ Dashboard accessible")
                 
                 # Look for navigation links
-                nav_links = re.findall(r'href="([^"]*(?:usage|solar|feed|report|bill|account)[^"]*)"', html, re.IGNORECASE)
+                nav_links = _NAV_RE.findall(html)
                 if nav_links:
                     print(f"🔗 Found navigation links: {nav_links}")
                 
@@ -101,33 +119,35 @@ async def check_portal_pages():
             "/account"
         ]
         
-        for page in test_pages:
-            url = f"https://secure.meridianenergy.co.nz{page}"
-            try:
-                async with session.get(url, headers=headers) as response:
-                    status = "✅" if response.status == 200 else "❌"
-                    print(f"   {status} {url} - Status: {response.status}")
-                    
-                    if response.status == 200:
-                        html = await response.text()
-                        
-                        # Look for energy data
-                        kwh_matches = re.findall(r'(\d+\.?\d*)\s*kWh', html, re.IGNORECASE)
-                        if kwh_matches:
-                            print(f"      💡 Found kWh values: {kwh_matches[:3]}")
-                        
-                        # Look for dollar amounts  
-                        dollar_matches = re.findall(r'\$(\d+\.?\d*)', html)
-                        if dollar_matches:
-                            print(f"      💰 Found dollar amounts: {dollar_matches[:3]}")
-                        
-                        # Look for download links
-                        download_links = re.findall(r'href="([^"]*(?:download|export|csv)[^"]*)"', html, re.IGNORECASE)
-                        if download_links:
-                            print(f"      📥 Download links: {download_links}")
-                            
-            except Exception as e:
-                print(f"   ⚠️ {url} - Error: {e}")
+        urls = [f"https://secure.meridianenergy.co.nz{page}" for page in test_pages]
+        results = await asyncio.gather(
+            *(fetch(session, sem, url, headers) for url in urls),
+            return_exceptions=True,
+        )
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                print(f"   ⚠️ {url} - Error: {result}")
+                continue
+            
+            status_code, html = result
+            status = "✅" if status_code == 200 else "❌"
+            print(f"   {status} {url} - Status: {status_code}")
+            
+            if status_code == 200:
+                # Look for energy data
+                kwh_matches = _KWH_RE.findall(html)
+                if kwh_matches:
+                    print(f"      💡 Found kWh values: {kwh_matches[:3]}")
+                
+                # Look for dollar amounts  
+                dollar_matches = _DOLLAR_RE.findall(html)
+                if dollar_matches:
+                    print(f"      💰 Found dollar amounts: {dollar_matches[:3]}")
+                
+                # Look for download links
+                download_links = _DOWNLOAD_RE.findall(html)
+                if download_links:
+                    print(f"      📥 Download links: {download_links}")
         
         print("\n" + "=" * 40)
         print("🎯 Please share this output so we can fix the integration!")
@@ -8,7 +8,9 @@ import asyncio
 import aiohttp
 import json
 import logging
+import re
 from datetime import datetime, timedelta
+from itertools import islice
 import sys
 import os
 
@@ -18,6 +20,8 @@ logging.basicConfig(
     format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
 )
 
+_TOKEN_RE = re.compile(r'name="authenticity_token"\s+value="([^"]+)"')
+
 async def test_sensor_data_extraction():
     """Test data extraction as the HA coordinator would do it"""
     print("🚀 Testing Meridian Solar Data Extraction for HA Sensors")
@@ -47,8 +51,7 @@ async def test_sensor_data_extraction():
                 return
             
             html = await response.text()
-            import re
-            token_match = re.search(r'name="authenticity_token"\s+value="([^"]+)"', html)
+            token_match = _TOKEN_RE.search(html)
             if not token_match:
                 print("❌ Can't find CSRF token")
                 return
@@ -89,7 +92,7 @@ async def test_sensor_data_extraction():
                 print(f"✅ CSV download successful: {len(csv_data)} bytes")
                 
                 # Parse CSV for sensor data
-                lines = csv_data.strip().split('\n')
+                lines = csv_data.splitlines()
                 print(f"   CSV has {len(lines)} lines")
                 
                 if len(lines) > 1:
@@ -98,7 +101,8 @@ async def test_sensor_data_extraction():
                         print(f"   {i+1}: {line[:80]}...")
                 
                 # Extract today's data (what HA sensors would show)
-                today = datetime.now().strftime("%-d/%-m/%Y")
+                now = datetime.now()
+                today = f"{now.day}/{now.month}/{now.year}"
                 sensor_data = {
                     "current_rate": 0.25,
                     "next_rate": 0.25,
@@ -110,8 +114,8 @@ async def test_sensor_data_extraction():
                 
                 print(f"\n📊 Extracting sensor data for {today}...")
                 
-                for line in lines[1:]:  # Skip header
-                    if not line.strip():
+                for line in islice(lines, 1, None):  # Skip header without copying the list
+                    if not line:
                         continue
                     
                     parts = line.split(',')
@@ -10,6 +10,25 @@ import json
 import re
 from datetime import datetime
 
+_TOKEN_RE = re.compile(r'name="authenticity_token"\s+value="([^"]+)"')
+_KWH_RE = re.compile(r'(\d+\.?\d*)\s*kWh', re.IGNORECASE)
+_DOLLAR_RE = re.compile(r'\$(\d+\.?\d*)')
+_ENERGY_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'generation[:\s]*(\d+\.?\d*)',
+    r'solar[:\s]*(\d+\.?\d*)',
+    r'feed.?in[:\s]*(\d+\.?\d*)',
+    r'export[:\s]*(\d+\.?\d*)',
+    r'consumption[:\s]*(\d+\.?\d*)',
+))
+
+async def fetch(session, sem, url, headers):
+    """GET a URL, returning its status, content type and text (None unless 200)"""
+    async with sem:
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                return response.status, "", None
+            return response.status, response.headers.get('content-type', ''), await response.text()
+
 async def test_enhanced_extraction():
     """Test enhanced data extraction like the updated integration"""
     
@@ -25,7 +44,12 @@ async def test_enhanced_extraction():
     print("🚀 Testing Enhanced Meridian Integration (v2.3.0)")
     print("=" * 60)
     
-    session = aiohttp.ClientSession()
+    # Probes below run concurrently over one pooled, keep-alive connection set
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, keepalive_timeout=30)
+    )
+    # Keep in-flight probes at the per-host connection limit
+    sem = asyncio.Semaphore(8)
     
     try:
         # Step 1: Login (reusing the working login logic)
@@ -36,7 +60,7 @@ async def test_enhanced_extraction():
                 return
             
             html = await response.text()
-            token_match = re.search(r'name="authenticity_token"\s+value="([^"]+)"', html)
+            token_match = _TOKEN_RE.search(html)
             if not token_match:
                 print("❌ Can't find CSRF token")
                 return
@@ -88,35 +112,41 @@ async def test_enhanced_extraction():
         ]
         
         csv_found = False
-        for csv_url in csv_urls:
-            try:
-                async with session.get(csv_url, headers=headers) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get('content-type', '')
-                        csv_data = await response.text()
-                        
-                        # Enhanced CSV detection
-                        if ('csv' in content_type.lower() or 'text' in content_type.lower() or 
-                            'application/octet-stream' in content_type.lower() or
-                            ',' in csv_data or 'Date,Time' in csv_data or 'Feed-in' in csv_data or
-                            'Consumption' in csv_data or len(csv_data) > 100):
-                            
-                            lines = csv_data.split('\n')[:5]
-                            if any(',' in line for line in lines if line.strip()):
-                                print(f"✅ Found CSV at: {csv_url}")
-                                print(f"   Content-Type: {content_type}")
-                                print(f"   Data size: {len(csv_data)} bytes")
-                                print(f"   Sample lines:")
-                                for i, line in enumerate(lines):
-                                    if line.strip():
-                                        print(f"   {i+1}: {line[:80]}...")
-                                csv_found = True
-                                break
-                    else:
-                        print(f"   ❌ {csv_url}: {response.status}")
-                        
-            except Exception as e:
-                print(f"   ⚠️ {csv_url}: {e}")
+        # Request every URL at once, but check them in order and stop at the
+        # first CSV; the requests still in flight are cancelled
+        tasks = [asyncio.create_task(fetch(session, sem, csv_url, headers)) for csv_url in csv_urls]
+        try:
+            for csv_url, task in zip(csv_urls, tasks):
+                try:
+                    status, content_type, csv_data = await task
+                except Exception as e:
+                    print(f"   ⚠️ {csv_url}: {e}")
+                    continue
+                
+                if status != 200:
+                    print(f"   ❌ {csv_url}: {status}")
+                    continue
+                
+                # Enhanced CSV detection
+                if ('csv' in content_type.lower() or 'text' in content_type.lower() or 
+                    'application/octet-stream' in content_type.lower() or
+                    ',' in csv_data or 'Date,Time' in csv_data or 'Feed-in' in csv_data or
+                    'Consumption' in csv_data or len(csv_data) > 100):
+                    
+                    lines = csv_data.splitlines()[:5]
+                    if any(',' in line for line in lines):
+                        print(f"✅ Found CSV at: {csv_url}")
+                        print(f"   Content-Type: {content_type}")
+                        print(f"   Data size: {len(csv_data)} bytes")
+                        print(f"   Sample lines:")
+                        for i, line in enumerate(lines):
+                            if line.strip():
+                                print(f"   {i+1}: {line[:80]}...")
+                        csv_found = True
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
         
         if not csv_found:
             print("❌ No CSV data found")
@@ -138,44 +168,40 @@ async def test_enhanced_extraction():
             "energy_patterns": []
         }
         
-        for url, page_type in pages_to_scrape:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        print(f"✅ Scraped {page_type} page ({len(html)} bytes)")
-                        
-                        # Extract kWh values
-                        kwh_matches = re.findall(r'(\d+\.?\d*)\s*kWh', html, re.IGNORECASE)
-                        if kwh_matches:
-                            found_data["kwh_values"].extend(kwh_matches[:3])
-                            print(f"   💡 kWh values: {kwh_matches[:3]}")
-                        
-                        # Extract dollar amounts
-                        dollar_matches = re.findall(r'\$(\d+\.?\d*)', html)
-                        if dollar_matches:
-                            found_data["dollar_values"].extend(dollar_matches[:3])
-                            print(f"   💰 Dollar amounts: {dollar_matches[:3]}")
-                        
-                        # Look for energy patterns
-                        energy_patterns = [
-                            r'generation[:\s]*(\d+\.?\d*)',
-                            r'solar[:\s]*(\d+\.?\d*)',
-                            r'feed.?in[:\s]*(\d+\.?\d*)',
-                            r'export[:\s]*(\d+\.?\d*)',
-                            r'consumption[:\s]*(\d+\.?\d*)',
-                        ]
-                        
-                        for pattern in energy_patterns:
-                            matches = re.findall(pattern, html, re.IGNORECASE)
-                            if matches:
-                                found_data["energy_patterns"].extend(matches[:2])
-                                print(f"   ⚡ Energy pattern ({pattern}): {matches[:2]}")
-                    else:
-                        print(f"   ❌ {page_type}: {response.status}")
-                        
-            except Exception as e:
-                print(f"   ⚠️ {page_type}: {e}")
+        results = await asyncio.gather(
+            *(fetch(session, sem, url, headers) for url, _ in pages_to_scrape),
+            return_exceptions=True,
+        )
+        for (url, page_type), result in zip(pages_to_scrape, results):
+            if isinstance(result, Exception):
+                print(f"   ⚠️ {page_type}: {result}")
+                continue
+            
+            status, _, html = result
+            if status != 200:
+                print(f"   ❌ {page_type}: {status}")
+                continue
+            
+            print(f"✅ Scraped {page_type} page ({len(html)} bytes)")
+            
+            # Extract kWh values
+            kwh_matches = _KWH_RE.findall(html)
+            if kwh_matches:
+                found_data["kwh_values"].extend(kwh_matches[:3])
+                print(f"   💡 kWh values: {kwh_matches[:3]}")
+            
+            # Extract dollar amounts
+            dollar_matches = _DOLLAR_RE.findall(html)
+            if dollar_matches:
+                found_data["dollar_values"].extend(dollar_matches[:3])
+                print(f"   💰 Dollar amounts: {dollar_matches[:3]}")
+            
+            # Look for energy patterns
+            for energy_re in _ENERGY_RES:
+                matches = energy_re.findall(html)
+                if matches:
+                    found_data["energy_patterns"].extend(matches[:2])
+                    print(f"   ⚡ Energy pattern ({energy_re.pattern}): {matches[:2]}")
         
         # Summary
         print("\n" + "=" * 60)
@@ -486,7 +486,7 @@ class MeridianPortalTester:
                             content_type = response.headers.get('content-type', '')
                             if 'csv' in content_type.lower() or 'text' in content_type.lower():
                                 csv_data = await response.text()
-                                lines = csv_data.split('\n')[:5]  # First 5 lines
+                                lines = csv_data.splitlines()[:5]  # First 5 lines
                                 print(f"   ✅ CSV download successful!")
                                 print(f"   Content-Type: {content_type}")
                                 print(f"   First few lines:")
@@ -8,6 +8,7 @@ import aiohttp
 import json
 import re
 import statistics
+from itertools import islice
 
 async def test_average_daily_use():
     """Test extracting average daily use from Meridian portal"""
@@ -55,14 +56,14 @@ async def test_average_daily_use():
         async with session.get(csv_url, headers=headers) as response:
             if response.status == 200:
                 csv_data = await response.text()
-                lines = csv_data.strip().split('\n')
+                lines = csv_data.splitlines()
                 print(f"✅ CSV downloaded: {len(lines)} lines")
                 
                 # Calculate average from CSV
                 daily_consumption_values = []
                 
-                for line in lines[1:]:  # Skip header
-                    if not line.strip():
+                for line in islice(lines, 1, None):  # Skip header without copying the list
+                    if not line:
                         continue
                         
                     parts = line.split(',')
@@ -5,6 +5,7 @@ Test the sensor fixes to ensure they never return "Unavailable"
 
 import sys
 import os
+from datetime import datetime
 
 # Add the integration path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components', 'meridian_solar'))
@@ -15,7 +16,7 @@ class MockCoordinator:
         self.data = data
         self.last_update_success = last_update_success
         self.username = "test@example.com"
-        self.last_update_success_time = "2025-09-01T19:45:00"
+        self.last_update_success_time = datetime(2025, 9, 1, 19, 45)
         self.update_interval = "30 minutes"
 
 def test_sensors():
@@ -25,64 +26,41 @@ def test_sensors():
     
     try:
         # Import sensor classes
-        from sensor import (
-            MeridianSolarRateSensor,
-            MeridianSolarGenerationSensor,
-            MeridianSolarDailyConsumptionSensor,
-            MeridianSolarDailyFeedInSensor,
-            MeridianSolarAverageDailyUseSensor
-        )
+        from sensor import MeridianSolarSensor, SENSORS
         
         # Test Case 1: No coordinator data (None)
         print("\n📊 Test Case 1: No coordinator data (coordinator.data = None)")
         coordinator_no_data = MockCoordinator(data=None)
         
-        sensors = [
-            MeridianSolarRateSensor(coordinator_no_data, "current"),
-            MeridianSolarRateSensor(coordinator_no_data, "next"),
-            MeridianSolarGenerationSensor(coordinator_no_data),
-            MeridianSolarDailyConsumptionSensor(coordinator_no_data),
-            MeridianSolarDailyFeedInSensor(coordinator_no_data),
-            MeridianSolarAverageDailyUseSensor(coordinator_no_data),
-        ]
+        sensors = [MeridianSolarSensor(coordinator_no_data, description) for description in SENSORS]
         
         for sensor in sensors:
             available = sensor.available
             value = sensor.native_value
-            print(f"   {sensor._attr_name}: available={available}, value={value}")
+            print(f"   {sensor.name}: available={available}, value={value}")
             
             if not available:
-                print(f"   ❌ FAILED: {sensor._attr_name} shows unavailable!")
+                print(f"   ❌ FAILED: {sensor.name} shows unavailable!")
             elif value is None:
-                print(f"   ❌ FAILED: {sensor._attr_name} returns None!")
+                print(f"   ❌ FAILED: {sensor.name} returns None!")
             else:
-                print(f"   ✅ PASS: {sensor._attr_name} returns valid value")
+                print(f"   ✅ PASS: {sensor.name} returns valid value")
         
         # Test Case 2: Empty coordinator data ({})
         print("\n📊 Test Case 2: Empty coordinator data (coordinator.data = {})")
         coordinator_empty_data = MockCoordinator(data={})
         
-        for i, sensor_class in enumerate([
-            (MeridianSolarRateSensor, "current"),
-            (MeridianSolarRateSensor, "next"),
-            (MeridianSolarGenerationSensor,),
-            (MeridianSolarDailyConsumptionSensor,),
-            (MeridianSolarDailyFeedInSensor,),
-            (MeridianSolarAverageDailyUseSensor,),
-        ]):
-            if len(sensor_class) == 2:
-                sensor = sensor_class[0](coordinator_empty_data, sensor_class[1])
-            else:
-                sensor = sensor_class[0](coordinator_empty_data)
+        for description in SENSORS:
+            sensor = MeridianSolarSensor(coordinator_empty_data, description)
             
             available = sensor.available
             value = sensor.native_value
-            print(f"   {sensor._attr_name}: available={available}, value={value}")
+            print(f"   {sensor.name}: available={available}, value={value}")
             
             if not available or value is None:
-                print(f"   ❌ FAILED: {sensor._attr_name} not working with empty data!")
+                print(f"   ❌ FAILED: {sensor.name} not working with empty data!")
             else:
-                print(f"   ✅ PASS: {sensor._attr_name} handles empty data correctly")
+                print(f"   ✅ PASS: {sensor.name} handles empty data correctly")
         
         # Test Case 3: Valid coordinator data
         print("\n📊 Test Case 3: Valid coordinator data")
@@ -95,27 +73,17 @@ def test_sensors():
             "average_daily_use": 25.4,
         })
         
-        for i, sensor_class in enumerate([
-            (MeridianSolarRateSensor, "current"),
-            (MeridianSolarRateSensor, "next"),
-            (MeridianSolarGenerationSensor,),
-            (MeridianSolarDailyConsumptionSensor,),
-            (MeridianSolarDailyFeedInSensor,),
-            (MeridianSolarAverageDailyUseSensor,),
-        ]):
-            if len(sensor_class) == 2:
-                sensor = sensor_class[0](coordinator_valid_data, sensor_class[1])
-            else:
-                sensor = sensor_class[0](coordinator_valid_data)
+        for description in SENSORS:
+            sensor = MeridianSolarSensor(coordinator_valid_data, description)
             
             available = sensor.available
             value = sensor.native_value
-            print(f"   {sensor._attr_name}: available={available}, value={value}")
+            print(f"   {sensor.name}: available={available}, value={value}")
             
             if not available or value is None:
-                print(f"   ❌ FAILED: {sensor._attr_name} not working with valid data!")
+                print(f"   ❌ FAILED: {sensor.name} not working with valid data!")
             else:
-                print(f"   ✅ PASS: {sensor._attr_name} returns correct value")
+                print(f"   ✅ PASS: {sensor.name} returns correct value")
         
         print("\n" + "=" * 50)
         print("🎯 CONCLUSION:")